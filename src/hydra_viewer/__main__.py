@@ -24,9 +24,9 @@ import argparse
 from importlib.metadata import version as _pkg_version
 from pathlib import Path
 
-import yaml
-
 from hydra_viewer.app import HydraViewer
+from hydra_viewer.utils.path_utils import list_yaml_files
+from hydra_viewer.utils.yaml_utils import has_defaults_list
 
 _VERSION = _pkg_version("hydra-viewer")
 
@@ -39,13 +39,9 @@ def _detect_config_dir() -> Path | None:
     otherwise None (the app will show the directory picker).
     """
     cwd = Path.cwd()
-    for p in sorted(cwd.glob("*.yaml")) + sorted(cwd.glob("*.yml")):
-        try:
-            content = yaml.safe_load(p.read_text(encoding="utf-8"))
-            if content and "defaults" in content:
-                return cwd
-        except Exception:
-            continue
+    for p in list_yaml_files(cwd):
+        if has_defaults_list(p):
+            return cwd
     return None
 
 
@@ -20,17 +20,17 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.timer import Timer
 from textual.widgets import Footer, Header, TextArea
 
-from hydra_viewer.core.merger import ConfigMerger
-from hydra_viewer.core.parser import HydraConfigParser
-from hydra_viewer.core.snapshot import SnapshotManager
 from hydra_viewer.widgets.command_bar import CommandBar
 from hydra_viewer.widgets.directory_picker import DirectoryPicker
 from hydra_viewer.widgets.file_browser import FileBrowser
@@ -40,6 +40,9 @@ from hydra_viewer.widgets.resolved_view import ResolvedView
 from hydra_viewer.widgets.snapshot_modals import BackupModal, RestoreModal
 from hydra_viewer.widgets.yaml_editor import YamlEditor
 
+if TYPE_CHECKING:
+    from hydra_viewer.core.merger import ConfigMerger
+
 
 class HydraViewer(App):
     TITLE = "Hydra Viewer [dev]"
@@ -105,9 +108,18 @@ class HydraViewer(App):
 
         self.current_overrides: str = ""
         self._multi_panel_mode: bool = True  # True = MultiPanelEditor, False = YamlEditor
-        self._debounce_timer: Timer | None = None
+        # Edits are saved after a short pause; the (more expensive) preview
+        # compose waits for a longer one so burst typing doesn't trigger it.
+        self._save_timer: Timer | None = None
+        self._preview_timer: Timer | None = None
 
     def init_core(self, config_dir: Path) -> None:
+        # Imported here so the TUI can paint before the YAML/OmegaConf/Hydra
+        # stack is loaded (e.g. while the directory picker is showing).
+        from hydra_viewer.core.merger import ConfigMerger
+        from hydra_viewer.core.parser import HydraConfigParser
+        from hydra_viewer.core.snapshot import SnapshotManager
+
         self.config_dir = config_dir
         self.parser = HydraConfigParser(self.config_dir)
         self.merger = ConfigMerger(self.config_dir)
@@ -115,6 +127,14 @@ class HydraViewer(App):
         self._org_files = self.parser.find_org_files()
 
     def on_mount(self) -> None:
+        # These widgets are composed once and never replaced, so look them up a
+        # single time instead of walking the DOM in every handler.
+        self._file_browser = self.query_one(FileBrowser)
+        self._module_tree = self.query_one(ModuleTree)
+        self._multi_panel = self.query_one(MultiPanelEditor)
+        self._yaml_editor = self.query_one(YamlEditor)
+        self._resolved_view = self.query_one(ResolvedView)
+
         if not self.config_dir:
             # If no config dir, show picker immediately
             self.action_open_directory()
@@ -147,12 +167,10 @@ class HydraViewer(App):
 
     async def on_module_tree_module_selected(self, message: ModuleTree.ModuleSelected) -> None:
         if self._multi_panel_mode:
-            editor = self.query_one(MultiPanelEditor)
             if message.module.path:
-                editor.scroll_to_path(message.module.path)
+                self._multi_panel.scroll_to_path(message.module.path)
         else:
-            editor_tabs = self.query_one(YamlEditor)
-            await editor_tabs.open_module(message.module)
+            await self._yaml_editor.open_module(message.module)
 
     def on_module_tree_org_file_changed(self, message: ModuleTree.OrgFileChanged) -> None:
         if not self.parser:
@@ -162,9 +180,8 @@ class HydraViewer(App):
             self.merger.set_main_config(message.path)
         modules = self.parser.reload()
         org_files = self.parser.find_org_files()
-        tree = self.query_one(ModuleTree)
-        tree.refresh_modules(modules, org_files=org_files, current_org=message.path)
-        self.query_one(MultiPanelEditor).load_modules(modules)
+        self._module_tree.refresh_modules(modules, org_files=org_files, current_org=message.path)
+        self._multi_panel.load_modules(modules)
         self.refresh_preview()
         self.notify(f"Switched to org file: {message.path.name}")
 
@@ -173,21 +190,11 @@ class HydraViewer(App):
             return
         try:
             self.parser.update_defaults_item(message.old, message.new_group, message.new_name)
-            self.notify(f"Updated defaults: {message.new_group}/{message.new_name}")
-            self.action_reload_all(notify=False)
         except Exception as e:
             self.notify(f"Failed to update defaults: {e}", severity="error")
             return
-        # Reload after writing back
-        modules = self.parser.reload()
-        org_files = self.parser.find_org_files()
-        tree = self.query_one(ModuleTree)
-        tree.refresh_modules(
-            modules,
-            org_files=org_files,
-            current_org=self.parser.main_config_path,
-        )
-        self.query_one(MultiPanelEditor).load_modules(modules)
+        # Reload after writing back (tree, editors and preview in one pass)
+        self.action_reload_all(notify=False)
         self.notify(f"Updated: {message.old.group}/{message.old.name} → {message.new_group}/{message.new_name}")
 
     async def on_file_browser_file_selected(self, message: FileBrowser.FileSelected) -> None:
@@ -195,28 +202,23 @@ class HydraViewer(App):
         if not self.parser:
             self._open_in_extra(path)
             return
-        modules = self.parser.parse()
-        module_paths = [m.path for m in modules if m.path]
-        if path in module_paths:
-            if self._multi_panel_mode:
-                self.query_one(MultiPanelEditor).scroll_to_path(path)
-            else:
-                for m in modules:
-                    if m.path == path:
-                        await self.query_one(YamlEditor).open_module(m)
-                        break
-        else:
+        module = next((m for m in self.parser.parse() if m.path == path), None)
+        if module is None:
             self._open_in_extra(path)
+        elif self._multi_panel_mode:
+            self._multi_panel.scroll_to_path(path)
+        else:
+            await self._yaml_editor.open_module(module)
 
     def _open_in_extra(self, path: Path) -> None:
         if self._multi_panel_mode:
-            self.query_one(MultiPanelEditor).open_extra_file(path)
+            self._multi_panel.open_extra_file(path)
         else:
             # In tab mode, open as a regular module tab
             from hydra_viewer.core.parser import ConfigModule
 
             dummy = ConfigModule(group="extra", name=path.stem, path=path, resolved=True)
-            self.run_worker(self.query_one(YamlEditor).open_module(dummy), exclusive=False)
+            self.run_worker(self._yaml_editor.open_module(dummy), exclusive=False)
 
     def on_file_browser_file_list_changed(self, _: FileBrowser.FileListChanged) -> None:
         # Refresh FileBrowser tree is handled internally inside FileBrowser.
@@ -226,51 +228,61 @@ class HydraViewer(App):
         # also fires on ordinary file-content saves (watchfiles tracks content
         # changes too), which would destroy the active TextArea and kick the
         # user out of edit mode.
+        if self.merger:
+            self.merger.invalidate()
         if self.parser:
+            self.parser.invalidate()
             org_files = self.parser.find_org_files()
-            tree = self.query_one(ModuleTree)
-            tree.refresh_modules(
+            self._module_tree.refresh_modules(
                 self.parser.parse(),
                 org_files=org_files,
                 current_org=self.parser.main_config_path,
             )
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        """Debounced auto-save: 500 ms after the last keystroke, save & refresh preview."""
+        """Debounced auto-save (500 ms) and preview refresh (800 ms) after the last keystroke."""
         if not self.parser:
             return
-        if self._debounce_timer is not None:
-            self._debounce_timer.stop()
-        self._debounce_timer = self.set_timer(0.5, self._auto_save_and_refresh)
-
-    def _auto_save_and_refresh(self) -> None:
-        """Silently save the currently focused file and refresh the resolved view."""
-        self._debounce_timer = None
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._save_timer = self.set_timer(0.5, self._auto_save)
+        self._preview_timer = self.set_timer(0.8, self._auto_refresh_preview)
+
+    async def _auto_save(self) -> None:
+        """Silently save the currently focused file."""
+        self._save_timer = None
         if self._multi_panel_mode:
-            self.query_one(MultiPanelEditor).save_current_file(silent=True)
+            await self._multi_panel.save_current_file(silent=True)
         else:
-            self.query_one(YamlEditor).save_current_file(silent=True)
+            await self._yaml_editor.save_current_file(silent=True)
+        if self.merger:
+            self.merger.invalidate()
+
+    def _auto_refresh_preview(self) -> None:
+        self._preview_timer = None
         self.refresh_preview()
 
-    def action_save_file(self) -> None:
+    async def action_save_file(self) -> None:
         if self._multi_panel_mode:
-            self.query_one(MultiPanelEditor).save_current_file()
+            await self._multi_panel.save_current_file()
         else:
-            self.query_one(YamlEditor).save_current_file()
+            await self._yaml_editor.save_current_file()
+        if self.merger:
+            self.merger.invalidate()
         self.refresh_preview()
 
     def action_toggle_editor(self) -> None:
         """Toggle between MultiPanelEditor and YamlEditor (tab mode)."""
         self._multi_panel_mode = not self._multi_panel_mode
-        mpe = self.query_one(MultiPanelEditor)
-        ye = self.query_one(YamlEditor)
         if self._multi_panel_mode:
-            mpe.remove_class("hidden")
-            ye.add_class("hidden")
+            self._multi_panel.remove_class("hidden")
+            self._yaml_editor.add_class("hidden")
             self.notify("Switched to multi-panel mode")
         else:
-            mpe.add_class("hidden")
-            ye.remove_class("hidden")
+            self._multi_panel.add_class("hidden")
+            self._yaml_editor.remove_class("hidden")
             self.notify("Switched to tab mode")
 
     def on_command_bar_command_changed(self, message: CommandBar.CommandChanged) -> None:
@@ -283,11 +295,14 @@ class HydraViewer(App):
 
         raw_overrides = self.current_overrides.split() if self.current_overrides else []
         valid_overrides = [ov for ov in raw_overrides if "=" in ov]
+        self._do_refresh_preview(self.merger, valid_overrides)
 
+    @work(exclusive=True, group="preview")
+    async def _do_refresh_preview(self, merger: "ConfigMerger", overrides: list[str]) -> None:
+        """Compose off the UI thread; a newer refresh cancels this one before it updates the view."""
         try:
-            merged_yaml = self.merger.merge(valid_overrides)
-            view = self.query_one(ResolvedView)
-            view.update_content(merged_yaml)
+            merged_yaml = await asyncio.to_thread(merger.merge, overrides)
+            self._resolved_view.update_content(merged_yaml)
         except Exception:
             pass
 
@@ -328,19 +343,20 @@ class HydraViewer(App):
             return
 
         # Keep merger in sync with the parser's currently active org file.
-        if self.merger and self.parser.main_config_path:
-            self.merger.set_main_config(self.parser.main_config_path)
+        if self.merger:
+            self.merger.invalidate()
+            if self.parser.main_config_path:
+                self.merger.set_main_config(self.parser.main_config_path)
 
         # Reload modules
+        self.parser.invalidate()
         modules = self.parser.parse()
         org_files = self.parser.find_org_files()
-        tree = self.query_one(ModuleTree)
-        tree.refresh_modules(modules, org_files=org_files, current_org=self.parser.main_config_path)
+        self._module_tree.refresh_modules(modules, org_files=org_files, current_org=self.parser.main_config_path)
 
         # Reload editors
-        self.query_one(YamlEditor).reload_all_tabs()
-        mpe = self.query_one(MultiPanelEditor)
-        mpe.load_modules(modules)
+        self._yaml_editor.schedule_reload()
+        self._multi_panel.load_modules(modules)
 
         # Refresh preview
         self.refresh_preview()
@@ -354,7 +370,7 @@ class HydraViewer(App):
                 self.init_core(path)
                 # Rebuild FileBrowser and restart watcher
                 try:
-                    self.query_one(FileBrowser).set_config_dir(path)
+                    self._file_browser.set_config_dir(path)
                 except Exception:
                     pass
                 self.action_reload_all(notify=False)
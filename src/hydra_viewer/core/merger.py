@@ -20,21 +20,80 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
+import re
+import threading
 from pathlib import Path
 from typing import Any
 
-import yaml
-from omegaconf import DictConfig, OmegaConf
+from hydra_viewer.utils.path_utils import index_yaml_files, list_yaml_files
+from hydra_viewer.utils.yaml_utils import dump_yaml, has_defaults_list, load_yaml
+
+# Hydra override: optional +/++/~ prefix, key, "=", value.
+_OVERRIDE_RE = re.compile(r"^(\+\+|\+|~)?([^=]+)=(.*)$")
+
+
+def _deep_merge(dst: dict[str, Any], src: dict[str, Any]) -> None:
+    """Recursively merge *src* into *dst* in place (mappings merge, everything else replaces)."""
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge(dst[key], value)
+        else:
+            # Copy so later merges never write into cached module data.
+            dst[key] = copy.deepcopy(value)
+
+
+def _to_yaml(cfg: Any, resolve: bool = False) -> str:
+    """Like OmegaConf.to_yaml, but dumped through libyaml when the container allows it."""
+    from omegaconf import OmegaConf
+
+    container = OmegaConf.to_container(cfg, resolve=resolve, enum_to_str=True)
+    try:
+        return dump_yaml(container)
+    except Exception:
+        return OmegaConf.to_yaml(cfg, resolve=resolve)
 
 
 class ConfigMerger:
     def __init__(self, config_dir: Path):
         self.config_dir = config_dir
         self._main_config_path: Path | None = None
+        # Result of the last _find_main_config() lookup; avoids re-scanning the
+        # config dir on every preview refresh.
+        self._main_cfg_cache: Path | None = None
+        # path -> (st_mtime_ns, parsed YAML); lets unchanged modules skip YAML parsing.
+        self._yaml_cache: dict[Path, tuple[int, Any]] = {}
+        # Relative POSIX paths of all YAML files under config_dir, built lazily.
+        self._file_index: set[str] | None = None
+        # (main config, overrides) -> YAML for the most recent merge; dropped by invalidate().
+        self._last_key: tuple[Any, ...] | None = None
+        self._last_yaml = ""
+        # Bumped by invalidate(). Cached results carry the generation they started
+        # under, so a merge that overlapped a bump can never be served later.
+        self._generation = 0
+        self._last_generation = -1
+        # Hydra stays initialized between merges; see _ensure_hydra().
+        self._hydra: Any = None
+        self._hydra_dir: str | None = None
+        # config_dir never changes for a merger (the app builds a new one per
+        # directory), so Path.resolve() only needs to run once.
+        self._resolved_config_dir_str: str | None = None
+        self._lock = threading.Lock()
 
     def set_main_config(self, path: Path) -> None:
         """Override the main config file used for merging (replaces auto-discovery)."""
         self._main_config_path = path
+        self._main_cfg_cache = path
+        self._yaml_cache.clear()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget the config dir's file inventory and last result; call after any config file changed."""
+        # Called from the UI thread while a merge may be running in a worker; the
+        # generation bump is what keeps that merge from caching a stale result.
+        self._generation += 1
+        self._file_index = None
+        self._last_key = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -53,11 +112,31 @@ class ConfigMerger:
           resolve=False and prepends a warning comment so the rest of the config is
           still readable.
         """
-        config_name = self._find_config_name()
-        if not config_name:
-            return "# Error: No config.yaml found"
+        with self._lock:
+            config_name = self._find_config_name()
+            if not config_name:
+                return "# Error: No config.yaml found"
 
+            # Overrides that parse to the same list (e.g. after a whitespace edit)
+            # give the same result until invalidate() reports a file change.
+            key = (self._main_cfg_cache, tuple(overrides or ()))
+            if key == self._last_key and self._last_generation == self._generation:
+                return self._last_yaml
+
+            generation = self._generation
+            result = self._merge_uncached(config_name, overrides)
+            self._last_key, self._last_yaml, self._last_generation = key, result, generation
+            return result
+
+    def _merge_uncached(self, config_name: str, overrides: list[str] | None) -> str:
         try:
+            if not overrides:
+                plain = self._plain_main_config()
+                if plain is not None:
+                    # Nothing for Hydra to compose; the file is the result.
+                    from omegaconf import OmegaConf
+
+                    return _to_yaml(OmegaConf.create(plain))
             return self._merge_with_hydra(config_name, overrides or [])
         except Exception as hydra_err:
             # Hydra not installed, config incompatible, etc. – fall back to manual.
@@ -68,23 +147,43 @@ class ConfigMerger:
     # Hydra compose path
     # ------------------------------------------------------------------
 
-    def _merge_with_hydra(self, config_name: str, overrides: list[str]) -> str:
-        from hydra import compose, initialize_config_dir
+    def _ensure_hydra(self) -> None:
+        """
+        Initialize Hydra for config_dir once and keep it around.
+
+        compose() builds a fresh config repository on every call, so file edits
+        are still picked up; only the search-path setup is reused.  If something
+        else re-initialized the global Hydra instance in the meantime (e.g. a
+        merger for another directory), we start over.
+        """
+        from hydra import initialize_config_dir
         from hydra.core.global_hydra import GlobalHydra
 
-        abs_config_dir = str(self.config_dir.resolve())
+        if self._resolved_config_dir_str is None:
+            self._resolved_config_dir_str = str(self.config_dir.resolve())
+        abs_config_dir = self._resolved_config_dir_str
+        gh = GlobalHydra.instance()
+        if self._hydra is not None and self._hydra_dir == abs_config_dir and gh.hydra is self._hydra:
+            return
 
-        GlobalHydra.instance().clear()
-        with initialize_config_dir(config_dir=abs_config_dir, version_base=None):
-            cfg = compose(config_name=config_name, overrides=overrides)
+        gh.clear()
+        initialize_config_dir(config_dir=abs_config_dir, version_base=None)
+        self._hydra = gh.hydra
+        self._hydra_dir = abs_config_dir
+
+    def _merge_with_hydra(self, config_name: str, overrides: list[str]) -> str:
+        from hydra import compose
+
+        self._ensure_hydra()
+        cfg = compose(config_name=config_name, overrides=overrides)
 
         # Attempt full interpolation resolution first.
         try:
-            return OmegaConf.to_yaml(cfg, resolve=True)
+            return _to_yaml(cfg, resolve=True)
         except Exception as resolve_err:
             # Some ${...} values couldn't be resolved (e.g. ${hydra:runtime.cwd}).
             # Show the unresolved template; the viewer is still useful.
-            raw = OmegaConf.to_yaml(cfg, resolve=False)
+            raw = _to_yaml(cfg)
             return f"# ⚠ Warning: some interpolations could not be resolved\n#   ({resolve_err})\n" + raw
 
     # ------------------------------------------------------------------
@@ -92,26 +191,31 @@ class ConfigMerger:
     # ------------------------------------------------------------------
 
     def _merge_manual(self, overrides: list[str] | None = None) -> str:
+        from omegaconf import OmegaConf
+
         try:
             main_cfg_path = self._find_main_config()
             if not main_cfg_path:
                 return "# Error: No config.yaml found"
 
-            base_cfg = OmegaConf.load(main_cfg_path)
-            if not isinstance(base_cfg, DictConfig):
-                base_cfg = DictConfig(base_cfg)
+            base = self._cached_load(main_cfg_path)
+            if base is None:
+                base = {}
+            if not isinstance(base, dict):
+                raise TypeError(f"{main_cfg_path.name} is not a mapping")
 
-            defaults = base_cfg.get("defaults", [])
-            defaults_list: list[Any] = OmegaConf.to_container(defaults, resolve=False) if defaults else []  # type: ignore
+            defaults_list: list[Any] = base.get("defaults") or []
 
-            merged_cfg = OmegaConf.create({})
+            # Merge plain dicts and convert to OmegaConf once at the end; far
+            # cheaper than building a DictConfig per merge step.
+            merged: dict[str, Any] = {}
 
             for item in defaults_list:
                 if isinstance(item, str):
                     if item == "_self_":
-                        merged_cfg = OmegaConf.merge(merged_cfg, base_cfg)
+                        _deep_merge(merged, base)
                     else:
-                        self._merge_module_by_name(merged_cfg, item)
+                        self._merge_module_by_name(merged, item)
                 elif isinstance(item, dict):
                     for group, name in item.items():
                         if not isinstance(group, str):
@@ -119,29 +223,22 @@ class ConfigMerger:
                         if group == "override" or group.startswith("override "):
                             continue
                         if isinstance(name, str):
-                            self._merge_module_by_group(merged_cfg, group, name)
+                            self._merge_module_by_group(merged, group, name)
 
             if not defaults_list:
-                merged_cfg = base_cfg
+                merged = base
+
+            merged_cfg = OmegaConf.create(merged)
 
             if overrides:
-                clean_overrides = []
-                for ov in overrides:
-                    if ov.startswith("~"):
-                        continue
-                    if "=" not in ov:
-                        continue
-                    key, value = ov.split("=", 1)
-                    if key.startswith("++"):
-                        key = key[2:]
-                    elif key.startswith("+"):
-                        key = key[1:]
-                    clean_overrides.append(f"{key}={value}")
+                # Deletions (~key) can't be expressed as a dotlist merge; skip them.
+                matches = [_OVERRIDE_RE.match(ov) for ov in overrides]
+                clean_overrides = [f"{m.group(2)}={m.group(3)}" for m in matches if m and m.group(1) != "~"]
                 if clean_overrides:
                     override_conf = OmegaConf.from_dotlist(clean_overrides)
                     merged_cfg = OmegaConf.merge(merged_cfg, override_conf)
 
-            return OmegaConf.to_yaml(merged_cfg)
+            return _to_yaml(merged_cfg)
 
         except Exception as e:
             return f"# Error merging config:\n# {str(e)}"
@@ -150,37 +247,75 @@ class ConfigMerger:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _cached_load(self, p: Path) -> Any:
+        """Parse a YAML file into plain Python data, memoized on the file's mtime."""
+        mtime = p.stat().st_mtime_ns
+        cached = self._yaml_cache.get(p)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        # From the file object, so parse errors name the file rather than "<byte string>".
+        with open(p, "rb") as f:
+            data = load_yaml(f)
+        self._yaml_cache[p] = (mtime, data)
+        return data
+
+    def _plain_main_config(self) -> dict[str, Any] | None:
+        """
+        Return the main config's data if composing it would be a no-op, else None.
+
+        That is the case when it has no defaults list, no ${...} interpolations,
+        no ``hydra`` node (which compose strips) and no ``@package`` directive.
+        """
+        p = self._find_main_config()
+        if not p:
+            return None
+        try:
+            raw = p.read_bytes()
+            if b"${" in raw or b"@package" in raw:
+                return None
+            data = self._cached_load(p)
+        except Exception:
+            return None
+        if data is None:
+            return {}
+        if not isinstance(data, dict) or "defaults" in data or "hydra" in data:
+            return None
+        return data
+
     def _find_config_name(self) -> str | None:
         p = self._find_main_config()
         return p.stem if p else None
 
     def _find_main_config(self) -> Path | None:
+        if self._main_cfg_cache and self._main_cfg_cache.exists():
+            return self._main_cfg_cache
+        self._main_cfg_cache = self._discover_main_config()
+        return self._main_cfg_cache
+
+    def _discover_main_config(self) -> Path | None:
         # Prefer explicitly set path (from user's org-file selection).
         if self._main_config_path and self._main_config_path.exists():
             return self._main_config_path
-        candidates = list(self.config_dir.glob("*.yaml"))
+        candidates = list_yaml_files(self.config_dir, (".yaml",))
         for cand in candidates:
-            try:
-                content = yaml.safe_load(cand.read_text(encoding="utf-8"))
-                if content and "defaults" in content:
-                    return cand
-            except Exception:
-                continue
+            if has_defaults_list(cand):
+                return cand
         return candidates[0] if candidates else None
 
-    def _merge_module_by_name(self, cfg: DictConfig, name: str) -> None:
-        p = self.config_dir / f"{name}.yaml"
-        if p.exists():
-            mod_cfg = OmegaConf.load(p)
-            cfg.merge_with(mod_cfg)
-
-    def _merge_module_by_group(self, cfg: DictConfig, group: str, name: str) -> None:
-        p = self.config_dir / group / f"{name}.yaml"
-        if p.exists():
-            mod_cfg = OmegaConf.load(p)
-            group_cfg = OmegaConf.create({group: mod_cfg})
-            cfg.merge_with(group_cfg)
-
-            loaded = OmegaConf.load(p)
-            group_cfg = OmegaConf.create({group: loaded})
-            cfg.merge_with(group_cfg)
+    def _has_file(self, rel: str) -> bool:
+        if self._file_index is None:
+            self._file_index = index_yaml_files(self.config_dir)
+        return rel in self._file_index
+
+    def _merge_module_by_name(self, cfg: dict[str, Any], name: str) -> None:
+        if self._has_file(f"{name}.yaml"):
+            p = self.config_dir / f"{name}.yaml"
+            mod_cfg = self._cached_load(p)
+            if isinstance(mod_cfg, dict):
+                _deep_merge(cfg, mod_cfg)
+
+    def _merge_module_by_group(self, cfg: dict[str, Any], group: str, name: str) -> None:
+        if self._has_file(f"{group}/{name}.yaml"):
+            p = self.config_dir / group / f"{name}.yaml"
+            mod_cfg = self._cached_load(p)
+            _deep_merge(cfg, {group: mod_cfg if mod_cfg is not None else {}})
@@ -20,13 +20,63 @@
 #
 # SPDX-License-Identifier: MIT
 
+import os
 import re
+import sys
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-from omegaconf import DictConfig, OmegaConf
+from hydra_viewer.utils.path_utils import index_yaml_files, list_yaml_files
+from hydra_viewer.utils.yaml_utils import has_defaults_list, load_yaml
+
+# Column-0 content lines, i.e. top-level keys; the defaults block ends at the next one.
+_TOP_LEVEL_LINE_RE = re.compile(r"^[^ \t\-#\r\n].*$", re.MULTILINE)
+_DEFAULTS_KEY_RE = re.compile(r"defaults[ \t]*:")
+
+
+def _replace_unique_entry(text: str, needle: str, replacement: str) -> str | None:
+    """
+    Replace *needle* with plain string ops when it is unambiguous.
+
+    Applies only when *needle* occurs exactly once, fills its line apart from
+    indentation and trailing whitespace, and sits inside the top-level
+    defaults block.  Returns None otherwise so the caller takes the regex path.
+    """
+    i = text.find(needle)
+    if i == -1 or text.find(needle, i + 1) != -1:
+        return None
+    line_start = text.rfind("\n", 0, i) + 1
+    end = i + len(needle)
+    eol = text.find("\n", end)
+    if text[line_start:i].strip(" \t") or text[end : len(text) if eol == -1 else eol].strip():
+        return None
+    last_key = None
+    for m in _TOP_LEVEL_LINE_RE.finditer(text, 0, line_start):
+        last_key = m
+    if last_key is None or not _DEFAULTS_KEY_RE.match(last_key.group()):
+        return None
+    return text[:i] + replacement + text[end:]
+
+
+@lru_cache(maxsize=256)
+def _compile_patterns(group: str, name: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Return the (string-style, dict-style) defaults-entry patterns for group/name."""
+    old_group = re.escape(group)
+    old_name = re.escape(name)
+
+    # Pattern 1: "  - group/name" (string style, possibly with spaces)
+    pat_str = re.compile(
+        r"^(?P<indent>[ \t]*)- (?P<override>override )?(?P<gn>" + old_group + r"/" + old_name + r")(?P<rest>\s*)$",
+        re.MULTILINE,
+    )
+    # Pattern 2: "  - group: name" or "  - override group: name"
+    pat_dict = re.compile(
+        r"^(?P<indent>[ \t]*)- (?P<override>override )?" + old_group + r"\s*:\s*" + old_name + r"(?P<rest>\s*)$",
+        re.MULTILINE,
+    )
+    return pat_str, pat_dict
 
 
 @dataclass
@@ -41,37 +91,97 @@ class ConfigModule:
     def __str__(self) -> str:
         return f"{self.group}={self.name}"
 
+    @cached_property
+    def tab_id(self) -> str:
+        """Widget id of this module's YamlEditor tab; group and name are never reassigned."""
+        norm_group = self.group.replace("/", "_").replace(" ", "_")
+        norm_name = self.name.replace("/", "_").replace(".", "_")
+        # Interned: the id keys several YamlEditor dicts and Textual's widget registry.
+        return sys.intern(f"tab-{norm_group}-{norm_name}")
+
 
 class HydraConfigParser:
     def __init__(self, config_dir: Path):
         self.config_dir = config_dir
         self.main_config_path = self._find_main_config()
+        # parse() memo keyed on the main config's (path, mtime_ns, size);
+        # find_org_files() memo keyed on _root_signature().
+        self._parse_cache: tuple[tuple, list[ConfigModule]] | None = None
+        self._org_files_cache: tuple[tuple, list[Path]] | None = None
+        # Relative POSIX paths of all YAML files under config_dir, built lazily.
+        self._existing_rel: set[str] | None = None
 
     def _find_main_config(self) -> Path | None:
         # Typically config.yaml, or a file with defaults list
-        candidates = list(self.config_dir.glob("*.yaml")) + list(self.config_dir.glob("*.yml"))
+        candidates = self._root_yaml_files()
         for cand in candidates:
             # simple heuristic: check if it has defaults
-            try:
-                content = yaml.safe_load(cand.read_text(encoding="utf-8"))
-                if content and "defaults" in content:
-                    return cand
-            except Exception:
-                continue
+            if has_defaults_list(cand):
+                return cand
         return candidates[0] if candidates else None
 
+    def _root_yaml_files(self) -> list[Path]:
+        """Root YAML files from one scandir pass: ``*.yaml`` first, then ``*.yml``, each by name."""
+        # sorted() is stable, so the by-name order from list_yaml_files survives.
+        return sorted(list_yaml_files(self.config_dir), key=lambda p: p.suffix == ".yml")
+
+    def _root_signature(self) -> tuple[int, int]:
+        """Cheap fingerprint of the root YAML files: (dir mtime, newest yaml mtime)."""
+        newest = 0
+        try:
+            with os.scandir(self.config_dir) as it:
+                for entry in it:
+                    if entry.name.endswith((".yaml", ".yml")) and entry.is_file():
+                        newest = max(newest, entry.stat().st_mtime_ns)
+            return self.config_dir.stat().st_mtime_ns, newest
+        except OSError:
+            return 0, newest
+
+    def invalidate(self) -> None:
+        """Drop memoized results, e.g. after files were added or removed under config_dir."""
+        self._parse_cache = None
+        self._org_files_cache = None
+        self._existing_rel = None
+
+    def _main_config_key(self) -> tuple:
+        path = self.main_config_path
+        if path is None:
+            return (None,)
+        try:
+            st = path.stat()
+        except OSError:
+            return (path,)
+        return (path, st.st_mtime_ns, st.st_size)
+
     def parse(self) -> list[ConfigModule]:
+        key = self._main_config_key()
+        if self._parse_cache and self._parse_cache[0] == key:
+            return list(self._parse_cache[1])
+        modules = self._parse_uncached()
+        self._parse_cache = (key, modules)
+        return list(modules)
+
+    def parse_from_bytes(self, data: bytes) -> list[ConfigModule]:
+        """Like parse(), but for callers that already read the main config's bytes."""
+        key = self._main_config_key()
+        if self._parse_cache and self._parse_cache[0] == key:
+            return list(self._parse_cache[1])
+        modules = self._parse_uncached(data)
+        self._parse_cache = (key, modules)
+        return list(modules)
+
+    def _parse_uncached(self, data: bytes | None = None) -> list[ConfigModule]:
         modules: list[ConfigModule] = []
         if not self.main_config_path:
             return modules
 
         try:
-            cfg = OmegaConf.load(self.main_config_path)
-            if not isinstance(cfg, DictConfig):
+            # Plain libyaml load: only the structure of defaults is needed, so
+            # interpolations stay as strings and no DictConfig is built.
+            content = load_yaml(self.main_config_path.read_bytes() if data is None else data)
+            if not isinstance(content, dict):
                 return modules
-            defaults_node = cfg.get("defaults", [])
-            # Convert to python types, don't resolve interpolations yet as we just want structure
-            defaults: list[Any] = OmegaConf.to_container(defaults_node, resolve=False) if defaults_node else []  # type: ignore
+            defaults: list[Any] = content.get("defaults") or []
         except Exception:
             return modules
 
@@ -151,11 +261,26 @@ class HydraConfigParser:
 
         return modules
 
+    def _exists(self, rel: str) -> bool:
+        """
+        Set lookup against one scandir walk of config_dir instead of a stat per module.
+
+        A miss is confirmed with a stat, so files created after the walk are still found.
+        """
+        if self._existing_rel is None:
+            self._existing_rel = index_yaml_files(self.config_dir)
+        if rel in self._existing_rel:
+            return True
+        if (self.config_dir / rel).is_file():
+            self._existing_rel.add(rel)
+            return True
+        return False
+
     def _resolve_string_item(self, modules: list[ConfigModule], item: str) -> None:
         # Check if item corresponds to a file
         for ext in [".yaml", ".yml"]:
-            p = self.config_dir / f"{item}{ext}"
-            if p.exists():
+            if self._exists(f"{item}{ext}"):
+                p = self.config_dir / f"{item}{ext}"
                 modules.append(ConfigModule(group="root", name=item, path=p, resolved=True))
                 return
 
@@ -175,9 +300,8 @@ class HydraConfigParser:
 
         prefix = "" if group == "root" else f"{group}/"
         for ext in [".yaml", ".yml"]:
-            p = self.config_dir / f"{prefix}{name}{ext}"
-            if p.exists():
-                full_path = p
+            if self._exists(f"{prefix}{name}{ext}"):
+                full_path = self.config_dir / f"{prefix}{name}{ext}"
                 resolved = True
                 break
 
@@ -194,10 +318,12 @@ class HydraConfigParser:
 
     def find_org_files(self) -> list[Path]:
         """Return all yaml files in config_dir root."""
-        result: list[Path] = []
-        for p in sorted(self.config_dir.glob("*.yaml")) + sorted(self.config_dir.glob("*.yml")):
-            result.append(p)
-        return result
+        key = self._root_signature()
+        if self._org_files_cache and self._org_files_cache[0] == key:
+            return list(self._org_files_cache[1])
+        result = self._root_yaml_files()
+        self._org_files_cache = (key, result)
+        return list(result)
 
     def set_main_config(self, path: Path) -> None:
         """Switch the active org file. Call reload() afterwards to refresh parsed modules."""
@@ -205,6 +331,8 @@ class HydraConfigParser:
 
     def reload(self) -> list[ConfigModule]:
         """Re-parse using the current main_config_path and return the fresh module list."""
+        self._parse_cache = None
+        self._existing_rel = None
         return self.parse()
 
     def update_defaults_item(self, old: "ConfigModule", new_group: str, new_name: str) -> None:
@@ -222,32 +350,48 @@ class HydraConfigParser:
 
         text = self.main_config_path.read_text(encoding="utf-8")
 
-        old_group = re.escape(old.group)
-        old_name = re.escape(old.name)
-
-        # Pattern 1: "  - group/name" (string style, possibly with spaces)
-        pat_str = re.compile(
-            r"^(?P<indent>[ \t]*)- (?P<override>override )?(?P<gn>" + old_group + r"/" + old_name + r")(?P<rest>\s*)$",
-            re.MULTILINE,
-        )
-        # Pattern 2: "  - group: name" or "  - override group: name"
-        pat_dict = re.compile(
-            r"^(?P<indent>[ \t]*)- (?P<override>override )?" + old_group + r"\s*:\s*" + old_name + r"(?P<rest>\s*)$",
-            re.MULTILINE,
-        )
-
-        def _repl_str(m: re.Match) -> str:  # type: ignore[type-arg]
-            override = m.group("override") or ""
-            return f"{m.group('indent')}- {override}{new_group}/{new_name}{m.group('rest')}"
-
-        def _repl_dict(m: re.Match) -> str:  # type: ignore[type-arg]
+        # Common case: the entry appears once, so no regex is needed.  A
+        # string-style entry (even with an override prefix) takes precedence,
+        # so the dict form is only tried when group/name never appears.
+        new_text = _replace_unique_entry(text, f"- {old.group}/{old.name}", f"- {new_group}/{new_name}")
+        if new_text is None and f"{old.group}/{old.name}" not in text:
+            new_text = _replace_unique_entry(text, f"- {old.group}: {old.name}", f"- {new_group}: {new_name}")
+        if new_text is not None:
+            self.main_config_path.write_text(new_text, encoding="utf-8")
+            return
+
+        pat_str, pat_dict = _compile_patterns(old.group, old.name)
+
+        lines = text.splitlines(keepends=True)
+
+        # One pass over the defaults block only, which ends at the next
+        # column-0 key.  String-style matches win over dict-style ones.
+        str_hits: list[tuple[int, re.Match[str]]] = []
+        dict_hits: list[tuple[int, re.Match[str]]] = []
+        in_defaults = False
+        for i, line in enumerate(lines):
+            stripped = line.lstrip()
+            if not in_defaults:
+                in_defaults = line.startswith("defaults") and stripped[8:].lstrip().startswith(":")
+                continue
+            if stripped and line[0] not in " \t-#\r\n":
+                break
+            if not stripped.startswith("- "):
+                continue
+            m = pat_str.match(line)
+            if m:
+                str_hits.append((i, m))
+            elif not str_hits:
+                m = pat_dict.match(line)
+                if m:
+                    dict_hits.append((i, m))
+
+        hits, sep = (str_hits, "/") if str_hits else (dict_hits, ": ")
+        if not hits:
+            raise ValueError(f"Could not find defaults entry for {old.group}/{old.name} in {self.main_config_path}")
+
+        for i, m in hits:
             override = m.group("override") or ""
-            return f"{m.group('indent')}- {override}{new_group}: {new_name}{m.group('rest')}"
-
-        new_text, n1 = pat_str.subn(_repl_str, text)
-        if n1 == 0:
-            new_text, n2 = pat_dict.subn(_repl_dict, text)
-            if n2 == 0:
-                raise ValueError(f"Could not find defaults entry for {old.group}/{old.name} in {self.main_config_path}")
+            lines[i] = f"{m.group('indent')}- {override}{new_group}{sep}{new_name}{m.group('rest')}"
 
-        self.main_config_path.write_text(new_text, encoding="utf-8")
+        self.main_config_path.write_text("".join(lines), encoding="utf-8")
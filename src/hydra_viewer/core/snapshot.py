@@ -21,12 +21,56 @@
 # SPDX-License-Identifier: MIT
 
 import json
+import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 
 from hydra_viewer.core.parser import HydraConfigParser
+from hydra_viewer.utils.path_utils import mtime_settled
+
+try:  # optional: orjson is several times faster for the meta.json round-trips
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _copy_many(pairs: list[tuple[Path, Path]]) -> list[Exception | None]:
+    """
+    Copy (source, dest) pairs concurrently; copies are I/O-bound and release the GIL.
+
+    Returns one entry per pair: None on success, or the exception it raised.
+    A failing copy does not stop the others.
+    """
+    for parent in {dest.parent for _, dest in pairs}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _copy(pair: tuple[Path, Path]) -> Exception | None:
+        try:
+            shutil.copy2(*pair)
+        except Exception as e:
+            return e
+        return None
+
+    if len(pairs) <= 1:
+        return [_copy(p) for p in pairs]
+    with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as ex:
+        return list(ex.map(_copy, pairs))
 
 
 @dataclass
@@ -43,6 +87,10 @@ class SnapshotManager:
         self.config_dir = config_dir
         self.backup_root = config_dir / self.BACKUP_DIR_NAME
         self.parser = HydraConfigParser(config_dir)
+        # (backup_root st_mtime_ns, snapshots) from the last list_snapshots() scan.
+        self._snap_cache: tuple[int, list[dict]] | None = None
+        # meta.json path -> (st_mtime_ns, parsed metadata), reused across rescans.
+        self._meta_cache: dict[str, tuple[int, dict]] = {}
 
     def verify_backup_dir(self) -> None:
         if not self.backup_root.exists():
@@ -50,6 +98,8 @@ class SnapshotManager:
 
     def create(self, tag: str) -> Path:
         self.verify_backup_dir()
+        # Nothing invalidates this manager's parser as files change; start from disk.
+        self.parser.invalidate()
         timestamp = time.time()
         # Create folder name: YYYYMMDD_HHMMSS_{tag}
         time_str = time.strftime("%Y%m%d_%H%M%S", time.localtime(timestamp))
@@ -57,60 +107,99 @@ class SnapshotManager:
         backup_path = self.backup_root / folder_name
         backup_path.mkdir()
 
+        # Read the org file once: the same bytes feed the parse and its backup copy.
+        main = self.parser.main_config_path
+        data: bytes | None = None
+        if main:
+            try:
+                data = main.read_bytes()
+            except OSError:
+                pass
+
         # Get all current modules
-        modules = self.parser.parse()
-        relative_paths = []
+        modules = self.parser.parse() if data is None else self.parser.parse_from_bytes(data)
+        relative_paths: list[str] = []
 
         # Backup config.yaml (root)
-        if self.parser.main_config_path:
+        if main and data is not None:
             try:
-                shutil.copy2(self.parser.main_config_path, backup_path / self.parser.main_config_path.name)
-                relative_paths.append(self.parser.main_config_path.name)
+                (backup_path / main.name).write_bytes(data)
+                shutil.copystat(main, backup_path / main.name)
+                relative_paths.append(main.name)
             except Exception:
                 pass
 
+        # relative path -> source file, in meta order; duplicates collapse.
+        sources: dict[str, Path] = {}
+
         # Backup resolved modules
         for mod in modules:
             if mod.resolved and mod.path:
                 try:
                     # Maintain directory structure inside backup?
                     # E.g. model/resnet.yaml -> backup/model/resnet.yaml
-                    rel_path = mod.path.relative_to(self.config_dir)
-                    dest = backup_path / rel_path
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(mod.path, dest)
-                    relative_paths.append(str(rel_path))
-                except Exception:
-                    pass
+                    rel = str(mod.path.relative_to(self.config_dir))
+                except ValueError:
+                    continue
+                if rel not in relative_paths:
+                    sources.setdefault(rel, mod.path)
+
+        errors = _copy_many([(src, backup_path / rel) for rel, src in sources.items()])
+        relative_paths += [rel for rel, err in zip(sources, errors, strict=True) if err is None]
 
         # Save metadata
         meta = SnapshotMeta(tag=tag, timestamp=timestamp, modules=relative_paths)
-        with open(backup_path / "meta.json", "w", encoding="utf-8") as f:
-            json.dump(asdict(meta), f, indent=2)
+        (backup_path / "meta.json").write_bytes(_dumps(asdict(meta)))
+        self._snap_cache = None
 
         return backup_path
 
     def list_snapshots(self) -> list[dict]:
-        if not self.backup_root.exists():
+        try:
+            mtime = self.backup_root.stat().st_mtime_ns
+        except OSError:
             return []
+        # Adding or removing a snapshot folder bumps backup_root's mtime.
+        if self._snap_cache and self._snap_cache[0] == mtime:
+            return list(self._snap_cache[1])
 
         snapshots = []
-        for d in self.backup_root.iterdir():
-            if d.is_dir():
-                meta_file = d / "meta.json"
-                if meta_file.exists():
+        meta_cache: dict[str, tuple[int, dict]] = {}
+        # scandir hands back the entry type with the name, so no stat per folder.
+        with os.scandir(self.backup_root) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                meta_file = os.path.join(entry.path, "meta.json")
+                try:
+                    meta_mtime = os.stat(meta_file).st_mtime_ns
+                except OSError:
+                    continue
+                cached = self._meta_cache.get(meta_file)
+                if cached and cached[0] == meta_mtime:
+                    data = cached[1]
+                else:
                     try:
-                        with open(meta_file, encoding="utf-8") as f:
-                            data = json.load(f)
-                            # add path to data
-                            data["path"] = str(d)
-                            snapshots.append(data)
+                        with open(meta_file, "rb") as f:
+                            data = _loads(f.read())
+                        # add path to data
+                        data["path"] = entry.path
                     except Exception:
-                        pass
+                        continue
+                meta_cache[meta_file] = (meta_mtime, data)
+                snapshots.append(data)
+        # Rebuilt each scan so entries for deleted snapshots are dropped.
+        self._meta_cache = meta_cache
 
         # Sort by timestamp desc
         snapshots.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-        return snapshots
+        # A just-touched folder may change again within the same mtime tick.
+        self._snap_cache = (mtime, snapshots) if mtime_settled(mtime) else None
+        return list(snapshots)
+
+    def snapshot_rows(self) -> list[tuple[str, float, str]]:
+        """(tag, timestamp, path) per snapshot, newest first, for table views."""
+        return [(s.get("tag", ""), s.get("timestamp", 0), s.get("path", "")) for s in self.list_snapshots()]
 
     def restore(self, snapshot_path: Path) -> None:
         # 1. Create a "pre-restore" backup automatically
@@ -126,15 +215,12 @@ class SnapshotManager:
         if not meta_file.exists():
             raise FileNotFoundError("Snapshot metadata not found")
 
-        with open(meta_file, encoding="utf-8") as f:
-            meta = json.load(f)
+        meta = _loads(meta_file.read_bytes())
 
         files = meta.get("modules", [])
 
-        for rel_path_str in files:
-            source = snapshot_path / rel_path_str
-            dest = self.config_dir / rel_path_str
-
-            if source.exists():
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, dest)
+        pairs = [(snapshot_path / rel, self.config_dir / rel) for rel in files if (snapshot_path / rel).exists()]
+        # Every file is attempted; the first failure is re-raised afterwards.
+        failed = next((err for err in _copy_many(pairs) if err is not None), None)
+        if failed is not None:
+            raise failed
@@ -20,15 +20,114 @@
 #
 # SPDX-License-Identifier: MIT
 
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
-import yaml
+from hydra_viewer.utils.yaml_utils import has_defaults_list
+
+
+def list_yaml_files(directory: Path, suffixes: tuple[str, ...] = (".yaml", ".yml")) -> list[Path]:
+    """
+    List the YAML files directly inside *directory*, sorted by name.
+
+    Uses a single os.scandir pass (cached dirent type info) instead of one
+    Path.glob per suffix; Path objects are only built for matching entries.
+    """
+    try:
+        with os.scandir(directory) as it:
+            names = [e.name for e in it if e.name.endswith(suffixes) and e.is_file()]
+    except OSError:
+        return []
+    return [directory / name for name in sorted(names)]
+
+
+# Never config groups, often huge (site-packages covers the bulk of an unhidden venv).
+_SKIP_DIRS = frozenset({"node_modules", "__pycache__", "site-packages"})
+
+
+def index_yaml_files(root: Path) -> set[str]:
+    """
+    Return the POSIX paths (relative to *root*) of every YAML file below *root*.
+
+    One recursive os.scandir walk, so later existence checks are set lookups
+    instead of a stat() each.  Hidden entries (e.g. ``.hydra_backups``, ``.git``)
+    and _SKIP_DIRS are skipped.  Symlinked directories are followed, but each
+    directory (by device and inode) is visited only once, so link loops end.
+    """
+    index: set[str] = set()
+    try:
+        st = os.stat(root)
+    except OSError:
+        return index
+    seen = {(st.st_dev, st.st_ino)}
+    stack = [("", os.fspath(root))]
+    while stack:
+        prefix, directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        if name in _SKIP_DIRS:
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        ident = (st.st_dev, st.st_ino)
+                        if ident not in seen:
+                            seen.add(ident)
+                            stack.append((f"{prefix}{name}/", entry.path))
+                    elif name.endswith((".yaml", ".yml")):
+                        index.add(prefix + name)
+        except OSError:
+            continue
+    return index
+
+
+# On coarse-mtime filesystems (NFS, FAT, some FUSE) two changes in one tick share an
+# mtime, so a listing is only cached under a timestamp at least this old.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+
+def mtime_settled(mtime_ns: int) -> bool:
+    """True once *mtime_ns* is old enough that any further change must move it."""
+    return time.time_ns() - mtime_ns >= _MTIME_SETTLE_NS
+
+
+# Entries that mark a project root; find_config_root does not search above one.
+_PROJECT_MARKERS = frozenset({".git", "pyproject.toml", "setup.py", "setup.cfg"})
+
+
+@lru_cache(maxsize=256)
+def _scan_dir(directory: str, mtime_ns: int) -> tuple[tuple[str, ...], bool]:
+    """Return (sorted YAML file names, has a project marker) for *directory*."""
+    # Adding, removing or renaming a file bumps the directory mtime, so the
+    # listing of a revisited directory can be reused as is (see mtime_settled).
+    names: list[str] = []
+    marker = False
+    try:
+        with os.scandir(directory) as it:
+            for e in it:
+                if e.name in _PROJECT_MARKERS:
+                    marker = True
+                elif e.name.endswith((".yaml", ".yml")) and e.is_file():
+                    names.append(e.name)
+    except OSError:
+        pass
+    return tuple(sorted(names)), marker
 
 
 def find_config_root(start_path: Path) -> Path | None:
     """
     Find the root configuration directory by looking for a config.yaml
     (or any yaml) that contains a 'defaults' list, traversing upwards.
+    The walk stops at the first project root (.git, pyproject.toml, ...)
+    or mount point.
 
     Args:
         start_path: The path to start searching from
@@ -40,21 +139,25 @@ def find_config_root(start_path: Path) -> Path | None:
     if current.is_file():
         current = current.parent
 
-    root = current.root
-
-    while current != root:
+    # Stop below the filesystem root (its parent is itself).
+    while current.parent != current:
         # Check for config.yaml or main.yaml or similar that has defaults
         # For simplicity in MVP, we look for any .yaml file that has a 'defaults' list
         # detailed hydra logic might be more complex, but this is a good heuristic
+        try:
+            mtime = current.stat().st_mtime_ns
+            scan = _scan_dir if mtime_settled(mtime) else _scan_dir.__wrapped__
+            names, marker = scan(os.fspath(current), mtime)
+        except OSError:
+            names, marker = (), False
+
+        # Directories without YAML files cost one stat on a revisit.
+        if any(has_defaults_list(current / name) for name in names):
+            return current
 
-        for yaml_file in current.glob("*.yaml"):
-            try:
-                with open(yaml_file, encoding="utf-8") as f:
-                    content = yaml.safe_load(f)
-                    if isinstance(content, dict) and "defaults" in content and isinstance(content["defaults"], list):
-                        return current
-            except Exception:
-                continue
+        # Don't wander out of the enclosing project or across a mount point.
+        if marker or os.path.ismount(current):
+            return None
 
         current = current.parent
 
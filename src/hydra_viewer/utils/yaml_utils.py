@@ -0,0 +1,215 @@
+# Copyright (c) 2026 Mengzhao Wang
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# SPDX-License-Identifier: MIT
+
+import codecs
+import os
+import pathlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any
+
+_DEFAULTS_LINE_RE = re.compile(rb"(?m)^defaults[ \t]*:")
+# Read size for the defaults probe; entry configs usually settle within the first chunk.
+_PROBE_CHUNK = 64 * 1024
+
+
+# OmegaConf's float rule: unlike YAML 1.1 it also accepts exponents without a dot (``1e3``).
+_FLOAT_RE = re.compile(
+    r"""^(?:
+     [-+]?[0-9]+(?:_[0-9]+)*\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?:[eE][-+]?[0-9]+)
+    |\.[0-9]+(?:_[0-9]+)*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$""",
+    re.X,
+)
+
+
+@lru_cache(maxsize=1)
+def _loader() -> type:
+    """
+    The libyaml-backed safe loader (when available) with OmegaConf.load's scalar rules.
+
+    Dates stay strings, ``1e3`` is a float and duplicate keys are an error, so
+    the plain data converts with OmegaConf.create() exactly like OmegaConf.load.
+    """
+    import yaml  # deferred: not needed for the common header-probe path
+
+    base = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class OmegaConfLoader(base):  # type: ignore[misc, valid-type]
+        def construct_mapping(self, node: Any, deep: bool = False) -> Any:
+            keys = set()
+            for key_node, _ in node.value:
+                if key_node.tag != yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG:
+                    continue
+                if key_node.value in keys:
+                    raise yaml.constructor.ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f"found duplicate key {key_node.value}",
+                        key_node.start_mark,
+                    )
+                keys.add(key_node.value)
+            return super().construct_mapping(node, deep=deep)
+
+    OmegaConfLoader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag != "tag:yaml.org,2002:timestamp"]
+        for first, resolvers in base.yaml_implicit_resolvers.items()
+    }
+    OmegaConfLoader.add_implicit_resolver("tag:yaml.org,2002:float", _FLOAT_RE, list("-+0123456789."))
+    for name in ("Path", "PosixPath", "WindowsPath"):
+        cls = getattr(pathlib, name)
+        OmegaConfLoader.add_constructor(
+            f"tag:yaml.org,2002:python/object/apply:pathlib.{name}",
+            lambda loader, node, cls=cls: cls(*loader.construct_sequence(node)),
+        )
+    return OmegaConfLoader
+
+
+def load_yaml(data: str | bytes | IO[bytes]) -> Any:
+    """Parse a YAML document into plain data the way OmegaConf.load reads it, via libyaml when available."""
+    import yaml
+
+    return yaml.load(data, Loader=_loader())
+
+
+# YAML 1.1 booleans, including the y/n forms PyYAML's resolver does not treat as bool.
+_YAML_BOOL_STRINGS = frozenset(
+    "y Y yes Yes YES n N no No NO true True TRUE false False FALSE on On ON off Off OFF".split()
+)
+
+
+def _needs_quotes(value: str) -> bool:
+    """OmegaConf's rule: quote strings that would read back as a bool, int or float."""
+    if value in _YAML_BOOL_STRINGS:
+        return True
+    for convert in (int, float):
+        try:
+            convert(value)
+            return True
+        except ValueError:
+            pass
+    return False
+
+
+@lru_cache(maxsize=1)
+def _dumper() -> type:
+    """The libyaml-backed safe dumper (when available) with OmegaConf.to_yaml's string quoting."""
+    import yaml
+
+    base = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    class OmegaConfDumper(base):  # type: ignore[misc, valid-type]
+        pass
+
+    def represent_str(dumper: Any, data: str) -> Any:
+        return dumper.represent_scalar(
+            yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG, data, style="'" if _needs_quotes(data) else None
+        )
+
+    OmegaConfDumper.add_representer(str, represent_str)
+    return OmegaConfDumper
+
+
+def dump_yaml(data: Any) -> str:
+    """
+    Serialize plain containers to block-style YAML like OmegaConf.to_yaml, via libyaml when available.
+
+    Raises yaml.representer.RepresenterError for values the safe dumper cannot
+    represent (e.g. ``pathlib.Path``); callers fall back to OmegaConf's own dumper.
+    """
+    import yaml
+
+    return yaml.dump(
+        data,
+        Dumper=_dumper(),
+        sort_keys=False,
+        default_flow_style=False,
+        allow_unicode=True,
+    )
+
+
+def _scan_defaults_list(data: bytes) -> bool | None:
+    """
+    Decide from raw bytes whether there is a top-level ``defaults`` list, without a YAML parser.
+
+    True: a column-0 ``defaults:`` followed by a ``-`` item or a ``[`` flow list.
+    False: ``defaults`` never appears.  None: anything else (quoted key, null
+    value, text cut off mid-header, ...), where a full parse has to decide.
+    """
+    m = _DEFAULTS_LINE_RE.search(data)
+    if m is None:
+        return None if b"defaults" in data else False
+    eol = data.find(b"\n", m.end())
+    rest = data[m.end() : eol if eol != -1 else len(data)].split(b" #", 1)[0].strip()
+    if rest:
+        return True if rest.startswith(b"[") else None
+    if eol == -1:
+        return None
+    for line in data[eol + 1 :].splitlines():
+        item = line.strip()
+        if not item or item.startswith(b"#"):
+            continue
+        return True if item == b"-" or item.startswith((b"- ", b"-\t")) else None
+    return None
+
+
+def _file_has_defaults_list(path: Path) -> bool | None:
+    """
+    Run _scan_defaults_list over *path*, reading on until a ``defaults`` list is found or EOF.
+
+    There is no header limit: a ``defaults:`` key behind long comments or other
+    keys is still seen.  Returns _scan_defaults_list's verdict on the whole file
+    when no list was found early.
+    """
+    data = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_PROBE_CHUNK):
+            data += chunk
+            # Rescan only when the new bytes (plus a word's overlap) mention defaults.
+            if b"defaults" not in data[-len(chunk) - 8 :]:
+                continue
+            if _scan_defaults_list(data.removeprefix(codecs.BOM_UTF8)) is True:
+                return True
+    return _scan_defaults_list(data.removeprefix(codecs.BOM_UTF8))
+
+
+@lru_cache(maxsize=512)
+def _probe_defaults(path_str: str, mtime_ns: int, size: int) -> bool:
+    # mtime_ns and size only key the cache: an edited file gets a fresh entry.
+    found = _file_has_defaults_list(Path(path_str))
+    if found is not None:
+        return found
+    content = load_yaml(Path(path_str).read_bytes())
+    return isinstance(content, dict) and isinstance(content.get("defaults"), list)
+
+
+def has_defaults_list(path: Path) -> bool:
+    """Return True if *path* is a YAML mapping whose top-level ``defaults`` is a list."""
+    try:
+        st = os.stat(path)
+        return _probe_defaults(os.fspath(path), st.st_mtime_ns, st.st_size)
+    except Exception:
+        return False
@@ -22,6 +22,7 @@
 
 from textual.app import ComposeResult
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Input, Static
 
 
@@ -62,9 +63,17 @@ class CommandBar(Static):
             self.overrides = overrides
             super().__init__()
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._debounce_timer: Timer | None = None
+
     def compose(self) -> ComposeResult:
         yield Static("Overrides:", id="cmd-label")
         yield Input(placeholder="e.g. ++model.layers=101", id="cmd-input")
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self.post_message(self.CommandChanged(event.value))
+        # Coalesce fast typing into one CommandChanged per 0.15 s pause.
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        value = event.value
+        self._debounce_timer = self.set_timer(0.15, lambda: self.post_message(self.CommandChanged(value)))
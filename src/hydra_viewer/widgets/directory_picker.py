@@ -26,6 +26,7 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, DirectoryTree, Footer, Header, Input, Label
+from textual.widgets.tree import TreeNode
 
 
 class DirectoryPicker(Screen[Path]):
@@ -143,7 +144,9 @@ class DirectoryPicker(Screen[Path]):
         elif button_id == "btn-up":
             tree = self.query_one("#dir-tree", DirectoryTree)
             try:
-                current_root = Path(tree.path).resolve()
+                # start_path, not tree.path: a submitted path may only have been
+                # revealed below the current root without re-rooting the tree.
+                current_root = self.start_path
                 parent = current_root.parent
                 # On windows, parent of "C:/" is "C:/".
                 if parent != current_root:
@@ -160,6 +163,20 @@ class DirectoryPicker(Screen[Path]):
         elif button_id == "cancel":
             self.dismiss(None)
 
+    @staticmethod
+    def _find_loaded_node(tree: DirectoryTree, path: Path) -> TreeNode | None:
+        """Return the already-loaded node for *path* under the tree's root, if any."""
+        try:
+            rel = path.relative_to(Path(tree.path).resolve())
+        except ValueError:
+            return None
+        node = tree.root
+        for part in rel.parts:
+            node = next((c for c in node.children if c.data is not None and c.data.path.name == part), None)
+            if node is None:
+                return None
+        return node
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         path_str = event.value
         try:
@@ -168,8 +185,15 @@ class DirectoryPicker(Screen[Path]):
                 self.start_path = new_path
                 self.selected_path = new_path
                 tree = self.query_one("#dir-tree", DirectoryTree)
-                # Setting path changes root
-                tree.path = str(new_path)
+                node = self._find_loaded_node(tree, new_path)
+                if node is not None:
+                    # Already loaded below the current root: reveal it instead
+                    # of rebuilding the whole tree.
+                    node.expand()
+                    tree.move_cursor(node)
+                else:
+                    # Setting path changes root
+                    tree.path = str(new_path)
                 tree.focus()
             else:
                 self.notify(f"Directory not found: {path_str}", severity="error")
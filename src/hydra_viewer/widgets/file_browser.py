@@ -23,26 +23,50 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import os
 import shutil
-from pathlib import Path
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any
 
 import watchfiles
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
-from textual.screen import ModalScreen
+from textual.notifications import SeverityLevel
+from textual.screen import ModalScreen, ScreenResultType
+from textual.timer import Timer
 from textual.widgets import Button, Input, Label, Static, Tree
 from textual.widgets.tree import TreeNode
 
+# Quiet period after a watcher-triggered refresh; further change batches within
+# it are coalesced into a single trailing refresh.
+_WATCH_DEBOUNCE = 0.25
+# watchfiles' defaults (1600 ms debounce, 50 ms step) suit CLIs; a TUI wants
+# single edits to land fast. FSEvents already coalesces on macOS.
+# Polling stays opt-in through watchfiles' own WATCHFILES_FORCE_POLLING.
+_WATCH_STEP_MS = 50 if sys.platform == "darwin" else 20
+_SELF_EDIT_WINDOW = 0.5
+# File-action notes arriving within this window share one toast.
+_NOTIFY_BATCH = 0.2
+_NOTIFY_MAX_LINES = 5
+
 # ---------------------------------------------------------------------------
 # Modals
 # ---------------------------------------------------------------------------
 
 
-class NewFileModal(ModalScreen[str | None]):
+class _ModalBase(ModalScreen[ScreenResultType]):
+    """Shared layout for the file-browser dialogs; subclasses only override what differs."""
+
     DEFAULT_CSS = """
-    NewFileModal {
+    _ModalBase {
         align: center middle;
     }
     #dialog {
@@ -74,6 +98,8 @@ class NewFileModal(ModalScreen[str | None]):
     }
     """
 
+
+class NewFileModal(_ModalBase[str | None]):
     def __init__(self, default_prefix: str = "", **kwargs) -> None:
         super().__init__(**kwargs)
         self._default_prefix = default_prefix
@@ -106,23 +132,14 @@ class NewFileModal(ModalScreen[str | None]):
             self.dismiss(None)
 
 
-class DeleteFileConfirmModal(ModalScreen[bool]):
+class DeleteFileConfirmModal(_ModalBase[bool]):
     DEFAULT_CSS = """
-    DeleteFileConfirmModal {
-        align: center middle;
-    }
     #dialog {
-        layout: vertical;
-        padding: 1;
-        width: 60;
         height: auto;
-        border: thick $background 80%;
-        background: $surface;
     }
     .buttons {
-        width: 100%;
         height: auto;
-        align: center middle;
+        dock: none;
     }
     Button {
         margin: 1 2;
@@ -147,39 +164,9 @@ class DeleteFileConfirmModal(ModalScreen[bool]):
             self.dismiss(False)
 
 
-class RenameFileModal(ModalScreen[str | None]):
+class RenameFileModal(_ModalBase[str | None]):
     """Rename a file – only the filename (basename) can be changed."""
 
-    DEFAULT_CSS = """
-    RenameFileModal {
-        align: center middle;
-    }
-    #dialog {
-        layout: vertical;
-        padding: 1;
-        width: 60;
-        height: 14;
-        border: thick $background 80%;
-        background: $surface;
-    }
-    #title {
-        height: 1;
-        content-align: center middle;
-        text-style: bold;
-        margin-bottom: 1;
-    }
-    Input {
-        margin-bottom: 2;
-    }
-    .buttons {
-        width: 100%;
-        height: 3;
-        align: center middle;
-        dock: bottom;
-    }
-    Button { margin: 0 1; }
-    """
-
     def __init__(self, old_name: str, **kwargs) -> None:
         super().__init__(**kwargs)
         self._old_name = old_name
@@ -206,37 +193,13 @@ class RenameFileModal(ModalScreen[str | None]):
             self.dismiss(None)
 
 
-class _PathInputModal(ModalScreen[str | None]):
+class _PathInputModal(_ModalBase[str | None]):
     """Shared base modal for Copy and Move: shows current rel path, user edits target."""
 
     DEFAULT_CSS = """
-    _PathInputModal {
-        align: center middle;
-    }
     #dialog {
-        layout: vertical;
-        padding: 1;
         width: 70;
-        height: 14;
-        border: thick $background 80%;
-        background: $surface;
-    }
-    #title {
-        height: 1;
-        content-align: center middle;
-        text-style: bold;
-        margin-bottom: 1;
-    }
-    Input {
-        margin-bottom: 2;
-    }
-    .buttons {
-        width: 100%;
-        height: 3;
-        align: center middle;
-        dock: bottom;
     }
-    Button { margin: 0 1; }
     """
 
     _action_label: str = "OK"
@@ -278,6 +241,170 @@ class MoveFileModal(_PathInputModal):
     _title_text = "Move To (relative to config dir):"
 
 
+# ---------------------------------------------------------------------------
+# Directory scanning (runs off the UI thread)
+# ---------------------------------------------------------------------------
+
+_YAML_EXT = (".yaml", ".yml")
+_SKIP_NAME = "__pycache__"
+
+
+@lru_cache(maxsize=1024)
+def _list_dir(path: str, mtime_ns: int) -> tuple[tuple[str, bool], ...]:
+    """
+    Sorted (name, is_dir) pairs of the entries shown for one directory.
+
+    Keyed on the directory's mtime, which changes whenever an entry is added,
+    removed or renamed, so unchanged directories are not rescanned.  The cache
+    is also cleared whenever the watcher or one of our own file actions reports
+    a change, since coarse mtimes can hide a second change in the same tick.
+    """
+    # Decorate once per entry: (is_file, lowered name, name) sorts directories
+    # first, then case-insensitively, and comparisons never touch the DirEntry.
+    # DirEntry caches the dirent type, so is_dir() needs no extra stat on most platforms.
+    decorated: list[tuple[bool, str, str]] = []
+    with os.scandir(path) as it:
+        for e in it:
+            name = e.name
+            if name[:1] == "." or name == _SKIP_NAME:
+                continue
+            is_dir = e.is_dir()
+            if is_dir or name.endswith(_YAML_EXT):
+                decorated.append((not is_dir, name.lower(), name))
+    decorated.sort()
+    return tuple((name, not is_file) for is_file, _, name in decorated)
+
+
+# (name, is_dir, path, children); children is None for files and for
+# directories that are not loaded yet.
+_Entry = tuple[str, bool, Path, "list[_Entry] | None"]
+
+
+def _scan_tree(path: Path, errors: list[str], expanded: set[Path] | frozenset[Path] = frozenset()) -> list[_Entry]:
+    """
+    Scan *path* into plain tuples for the file tree, descending only into
+    directories in *expanded*; unreadable directories are reported in *errors*.
+    """
+    result: list[_Entry] = []
+    # Iterative walk: each stack item is a directory and the list its entries go into.
+    stack: list[tuple[Path, list[_Entry]]] = [(path, result)]
+    while stack:
+        directory, out = stack.pop()
+        try:
+            listing = _list_dir(os.fspath(directory), os.stat(directory).st_mtime_ns)
+        except Exception as e:
+            errors.append(f"Error reading directory {directory}: {e}")
+            continue
+        for name, is_dir in listing:
+            item = directory / name
+            if is_dir and item in expanded:
+                children: list[_Entry] = []
+                out.append((name, True, item, children))
+                stack.append((item, children))
+            else:
+                out.append((name, is_dir, item, None))
+    return result
+
+
+def _header_text(config_dir: Path | None) -> str:
+    return f"Explorer: {config_dir.name}" if config_dir else "File Browser"
+
+
+def _ensure_yaml(name: str) -> str:
+    """Append ``.yaml`` unless *name* already has a YAML extension."""
+    return name if name.endswith(_YAML_EXT) else name + ".yaml"
+
+
+@lru_cache(maxsize=4096)
+def _rel_posix(root: str, path: str) -> str | None:
+    """*path* relative to *root* as a posix string, or None if it lies outside."""
+    try:
+        return PurePath(path).relative_to(root).as_posix()
+    except ValueError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Blocking file operations (run via asyncio.to_thread)
+# ---------------------------------------------------------------------------
+
+
+# Each helper claims ``dest`` atomically and raises ``_DestinationExists`` if it
+# is already taken, so callers need no separate (racy) existence check.  Other
+# failures (including a parent path that is a regular file) surface as OSError.
+
+_EXCL_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+
+
+class _DestinationExists(Exception):
+    """The target of a create, copy or move is already taken."""
+
+
+def _make_parent(path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except FileExistsError as e:
+        # exist_ok covers directories, so something else is in the way.
+        raise NotADirectoryError(f"Not a directory: {path.parent}") from e
+
+
+def _open_exclusive(path: Path) -> int:
+    try:
+        return os.open(path, _EXCL_FLAGS, 0o644)
+    except FileExistsError as e:
+        raise _DestinationExists(path) from e
+
+
+def _create_file(path: Path) -> None:
+    _make_parent(path)
+    os.close(_open_exclusive(path))
+
+
+def _copy_file(src: Path, dest: Path) -> None:
+    _make_parent(dest)
+    with open(src, "rb") as fsrc:
+        with open(_open_exclusive(dest), "wb") as fdst:
+            try:
+                shutil.copyfileobj(fsrc, fdst)
+            except BaseException:
+                os.unlink(dest)
+                raise
+    shutil.copystat(src, dest)
+
+
+def _move_symlink(src: Path, dest: Path) -> None:
+    """Recreate the link *src* at *dest*: claim *dest* exclusively, then swap a fresh link in."""
+    os.close(_open_exclusive(dest))
+    tmp = f"{dest}.tmp-link"
+    try:
+        os.symlink(os.readlink(src), tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        for leftover in (tmp, dest):
+            try:
+                os.unlink(leftover)
+            except OSError:
+                pass
+        raise
+
+
+def _move_file(src: Path, dest: Path) -> None:
+    _make_parent(dest)
+    try:
+        # link(2) never overwrites, making this a no-clobber rename. A symlink is
+        # linked itself, not its target, so it stays a symlink.
+        os.link(src, dest, follow_symlinks=False)
+    except FileExistsError as e:
+        raise _DestinationExists(dest) from e
+    except (OSError, NotImplementedError):
+        # Cross-device or no hard-link support: exclusive copy instead.
+        if os.path.islink(src):
+            _move_symlink(src, dest)
+        else:
+            _copy_file(src, dest)
+    os.unlink(src)
+
+
 # ---------------------------------------------------------------------------
 # FileBrowser widget
 # ---------------------------------------------------------------------------
@@ -339,23 +466,40 @@ class FileBrowser(Vertical):
     def __init__(self, config_dir: Path | None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.config_dir = config_dir
+        self._header_text = _header_text(config_dir)
         self._watcher_task: asyncio.Task[None] | None = None
-        # Suppress watcher-triggered refreshes while we are making our own changes
-        self._suppress_watch: bool = False
+        # Paths our own file actions touched -> monotonic time; the watcher drops
+        # their events for _SELF_EDIT_WINDOW seconds, external edits still get through.
+        self._self_edits: dict[str, float] = {}
+        self._watch_timer: Timer | None = None
+        self._refresh_timer: Timer | None = None
+        self._notify_timer: Timer | None = None
+        self._pending_notes: list[tuple[str, SeverityLevel]] = []
+        # watchfiles (Change, path) pairs waiting for the debounced refresh.
+        self._pending_changes: set[tuple[watchfiles.Change, str]] = set()
+        # Path -> tree node for every entry currently shown, for incremental updates.
+        self._node_index: dict[Path, TreeNode] = {}  # type: ignore[type-arg]
+        # Directories are read when first expanded: _loaded holds those whose
+        # children are in the tree, _expanded the ones to reopen after a rebuild.
+        self._loaded: set[Path] = set()
+        self._expanded: set[Path] = set()
+        self._tree_ref: Tree | None = None  # type: ignore[type-arg]
+        # (node, path, is_file) for the cursor node; cleared whenever the cursor moves.
+        self._cached_focus: tuple[TreeNode | None, Path | None, bool] | None = None  # type: ignore[type-arg]
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     def compose(self) -> ComposeResult:
-        label = f"Files: {self.config_dir.name}" if self.config_dir else "File Browser"
-        yield Static(f"{label}", id="browser-header")
+        yield Static(self._header_text, id="browser-header")
         yield Tree("Config Files", id="file-tree")
         with Horizontal(id="toolbar"):
             yield Button("+", id="add-file", variant="success", flat=True)
             yield Button("-", id="delete-file", variant="error", flat=True)
 
     def on_mount(self) -> None:
+        self._tree_ref = self.query_one("#file-tree", Tree)
         self.refresh_tree()
         self._restart_watcher()
 
@@ -369,6 +513,9 @@ class FileBrowser(Vertical):
     def set_config_dir(self, path: Path | None) -> None:
         """Switch the watched directory; cancels old watcher and starts a new one."""
         self.config_dir = path
+        self._header_text = _header_text(path)
+        self._expanded.clear()
+        _rel_posix.cache_clear()
         self.refresh_tree()
         self._restart_watcher()
 
@@ -380,6 +527,10 @@ class FileBrowser(Vertical):
         if self._watcher_task is not None:
             self._watcher_task.cancel()
             self._watcher_task = None
+        if self._watch_timer is not None:
+            self._watch_timer.stop()
+            self._watch_timer = None
+        self._pending_changes = set()
 
     def _restart_watcher(self) -> None:
         self._cancel_watcher()
@@ -391,13 +542,53 @@ class FileBrowser(Vertical):
         if not self.config_dir:
             return
         try:
-            async for _changes in watchfiles.awatch(self.config_dir):
-                if not self._suppress_watch:
-                    self.refresh_tree()
-                    self.post_message(self.FileListChanged())
+            async for changes in watchfiles.awatch(self.config_dir, debounce=200, step=_WATCH_STEP_MS):
+                # Directory mtimes can miss a change on coarse-mtime filesystems.
+                _list_dir.cache_clear()
+                # watchfiles reports paths under config_dir as given; resolve them to
+                # match the realpath keys of _self_edits and _apply_changes' root.
+                changes = {(change, os.path.realpath(raw)) for change, raw in changes}
+                changes = self._drop_self_edits(changes)
+                if changes:
+                    self._on_watch_batch(changes)
         except asyncio.CancelledError:
             pass
 
+    def _mark_self_edit(self, *paths: Path) -> None:
+        now = time.monotonic()
+        for path in paths:
+            self._self_edits[os.path.realpath(path)] = now
+
+    def _drop_self_edits(self, changes: set[tuple[watchfiles.Change, str]]) -> set[tuple[watchfiles.Change, str]]:
+        if not self._self_edits:
+            return changes
+        cutoff = time.monotonic() - _SELF_EDIT_WINDOW
+        self._self_edits = {p: t for p, t in self._self_edits.items() if t >= cutoff}
+        return {c for c in changes if c[1] not in self._self_edits}
+
+    def _on_watch_batch(self, changes: set[tuple[watchfiles.Change, str]]) -> None:
+        """
+        Refresh right away for an isolated change (leading edge), then coalesce
+        any burst that follows into one refresh once it has been quiet for
+        _WATCH_DEBOUNCE seconds.
+        """
+        self._pending_changes |= changes
+        if self._watch_timer is None:
+            self._refresh_from_watch()
+        else:
+            self._watch_timer.stop()
+        self._watch_timer = self.set_timer(_WATCH_DEBOUNCE, self._on_watch_quiet)
+
+    def _on_watch_quiet(self) -> None:
+        self._watch_timer = None
+        if self._pending_changes:
+            self._refresh_from_watch()
+
+    def _refresh_from_watch(self) -> None:
+        changes, self._pending_changes = self._pending_changes, set()
+        self._apply_changes(changes)
+        self.post_message(self.FileListChanged())
+
     # ------------------------------------------------------------------
     # Tree building
     # ------------------------------------------------------------------
@@ -408,29 +599,147 @@ class FileBrowser(Vertical):
 
         header = self.query_one("#browser-header", Static)
         try:
-            header.update(f"Explorer: {self.config_dir.name}")
+            header.update(self._header_text)
         except Exception:
             pass
 
-        tree = self.query_one("#file-tree", Tree)
+        self._load_tree(self.config_dir)
+
+    @work(exclusive=True, group="file-tree")
+    async def _load_tree(self, config_dir: Path) -> None:
+        """Scan in a thread so slow storage never blocks input; a newer refresh cancels this one."""
+        errors: list[str] = []
+        entries = await asyncio.to_thread(_scan_tree, config_dir, errors, set(self._expanded))
+        if config_dir != self.config_dir:
+            return
+        tree = self._tree_ref
+        if tree is None:
+            return
         tree.clear()
+        self._cached_focus = None
+        self._node_index.clear()
+        self._loaded = {config_dir}
         tree.root.expand()
-        self._build_tree(self.config_dir, tree.root)
+        self._populate(tree.root, entries)
+        for msg in errors:
+            self.app.notify(msg, severity="error")
+
+    def _populate(self, node: TreeNode, entries: list[_Entry]) -> None:  # type: ignore[type-arg]
+        """Add prebuilt entries under *node*; no filesystem access."""
+        stack = [(node, entries)]
+        while stack:
+            parent, children = stack.pop()
+            for name, is_dir, path, sub in children:
+                if is_dir:
+                    dir_node = parent.add(name, data=path, expand=sub is not None)
+                    self._node_index[path] = dir_node
+                    if sub is not None:
+                        self._loaded.add(path)
+                        stack.append((dir_node, sub))
+                else:
+                    self._node_index[path] = parent.add(name, data=path, allow_expand=False)
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce refreshes requested by our own file actions into one, 50 ms later."""
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(0.05, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        self._refresh_timer = None
+        _list_dir.cache_clear()
+        self.refresh_tree()
+        self.post_message(self.FileListChanged())
+
+    def _queue_notify(self, msg: str, severity: SeverityLevel = "information") -> None:
+        """Collect a file-action note; a burst is shown as one toast per severity."""
+        self._pending_notes.append((msg, severity))
+        if self._notify_timer is None:
+            self._notify_timer = self.set_timer(_NOTIFY_BATCH, self._flush_notes)
+
+    def _flush_notes(self) -> None:
+        self._notify_timer = None
+        notes, self._pending_notes = self._pending_notes, []
+        by_severity: dict[SeverityLevel, list[str]] = {}
+        for msg, severity in notes:
+            by_severity.setdefault(severity, []).append(msg)
+        for severity, msgs in by_severity.items():
+            text = "\n".join(msgs[:_NOTIFY_MAX_LINES])
+            if len(msgs) > _NOTIFY_MAX_LINES:
+                text += f"\n… and {len(msgs) - _NOTIFY_MAX_LINES} more"
+            self.app.notify(text, severity=severity)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
 
-    def _build_tree(self, path: Path, node: TreeNode) -> None:  # type: ignore[type-arg]
+    def _apply_changes(self, changes: set[tuple[watchfiles.Change, str]]) -> None:
+        """Patch the tree for watcher events; falls back to a full rebuild when that isn't possible."""
+        if not self.config_dir:
+            return
+        root = self.config_dir.resolve()
+        added: list[Path] = []
+        deleted: list[Path] = []
         try:
-            items = list(path.iterdir())
-            items.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
-            for item in items:
-                if item.name.startswith(".") or item.name == "__pycache__":
-                    continue
-                if item.is_dir():
-                    dir_node = node.add(item.name, data=item, expand=False)
-                    self._build_tree(item, dir_node)
-                elif item.suffix in (".yaml", ".yml"):
-                    node.add(item.name, data=item, allow_expand=False)
-        except Exception as e:
-            self.app.notify(f"Error reading directory {path}: {e}", severity="error")
+            for change, raw in changes:
+                rel = Path(raw).relative_to(root)
+                if not rel.parts:
+                    # config_dir itself changed (e.g. deleted or replaced).
+                    self.refresh_tree()
+                    return
+                if change == watchfiles.Change.added:
+                    added.append(self.config_dir / rel)
+                elif change == watchfiles.Change.deleted:
+                    deleted.append(self.config_dir / rel)
+                # Change.modified: contents only, nothing to show.
+            for path in deleted:
+                self._remove_node(path)
+            # Parents before children; a new directory's subtree is built in one go.
+            for path in sorted(added, key=lambda p: len(p.parts)):
+                self._add_node(path)
+        except Exception:
+            self.refresh_tree()
+
+    def _remove_node(self, path: Path) -> None:
+        node = self._node_index.pop(path, None)
+        if node is None:
+            return
+        stack = [node]
+        while stack:
+            child = stack.pop()
+            self._node_index.pop(child.data, None)
+            self._loaded.discard(child.data)
+            self._expanded.discard(child.data)
+            stack.extend(child.children)
+        node.remove()
+        self._cached_focus = None
+
+    def _add_node(self, path: Path) -> None:
+        if path in self._node_index or not path.exists():
+            return
+        rel = path.relative_to(self.config_dir)
+        if any(part[:1] == "." or part == _SKIP_NAME for part in rel.parts):
+            return
+        if path.parent not in self._loaded:
+            # Not visible yet; it is picked up when its directory is expanded.
+            return
+        if len(rel.parts) == 1:
+            parent = self._tree_ref.root if self._tree_ref is not None else None
+        else:
+            parent = self._node_index.get(path.parent)
+        if parent is None:
+            return
+        is_dir = path.is_dir()
+        if not is_dir and path.suffix not in _YAML_EXT:
+            return
+
+        # Keep the (directories first, case-insensitive name) order of _scan_tree.
+        keys = [(not child.allow_expand, child.data.name.lower()) for child in parent.children]
+        pos = bisect.bisect_right(keys, (not is_dir, path.name.lower()))
+        before = pos if pos < len(keys) else None
+        if is_dir:
+            self._node_index[path] = parent.add(path.name, data=path, before=before, expand=False)
+        else:
+            self._node_index[path] = parent.add(path.name, data=path, before=before, allow_expand=False)
 
     # ------------------------------------------------------------------
     # Toolbar buttons
@@ -448,6 +757,35 @@ class FileBrowser(Vertical):
     # Tree selection
     # ------------------------------------------------------------------
 
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:  # type: ignore[type-arg]
+        path = event.node.data
+        if not isinstance(path, Path):
+            return
+        self._expanded.add(path)
+        if path in self._loaded:
+            return
+        # First expansion: read this one directory level in a thread.
+        self._loaded.add(path)
+        self._expand_dir(event.node, path)
+
+    @work(group="file-tree-expand")
+    async def _expand_dir(self, node: TreeNode, path: Path) -> None:  # type: ignore[type-arg]
+        errors: list[str] = []
+        entries = await asyncio.to_thread(_scan_tree, path, errors, set(self._expanded))
+        if self._node_index.get(path) is not node:
+            return  # rebuilt or removed meanwhile; the new tree has its own contents
+        # The watcher may already have added some of these while we were scanning.
+        self._populate(node, [e for e in entries if e[2] not in self._node_index])
+        for msg in errors:
+            self.app.notify(msg, severity="error")
+
+    def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:  # type: ignore[type-arg]
+        if isinstance(event.node.data, Path):
+            self._expanded.discard(event.node.data)
+
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:  # type: ignore[type-arg]
+        self._cached_focus = None
+
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:  # type: ignore[type-arg]
         if event.node.data and isinstance(event.node.data, Path) and event.node.data.is_file():
             self.post_message(self.FileSelected(event.node.data))
@@ -456,32 +794,37 @@ class FileBrowser(Vertical):
     # Helpers
     # ------------------------------------------------------------------
 
+    def _cursor_entry(self) -> tuple[Path | None, bool]:
+        """(path, is_file) of the cursor node, computed once per cursor position."""
+        node = self._tree_ref.cursor_node if self._tree_ref is not None else None
+        # The node check covers cursor moves whose NodeHighlighted is still queued.
+        if self._cached_focus is None or self._cached_focus[0] is not node:
+            path = node.data if node and isinstance(node.data, Path) else None
+            self._cached_focus = (node, path, path is not None and path.is_file())
+        return self._cached_focus[1:]
+
     def _focused_dir(self) -> Path | None:
         """Return the directory context of the current cursor node."""
         if not self.config_dir:
             return None
-        tree = self.query_one("#file-tree", Tree)
-        node = tree.cursor_node
-        if node and node.data and isinstance(node.data, Path):
-            return node.data if node.data.is_dir() else node.data.parent
+        path, is_file = self._cursor_entry()
+        if path is not None:
+            return path.parent if is_file else path
         return self.config_dir
 
     def _focused_file(self) -> Path | None:
         """Return path of current cursor node if it is a file, else None."""
-        tree = self.query_one("#file-tree", Tree)
-        node = tree.cursor_node
-        if node and node.data and isinstance(node.data, Path) and node.data.is_file():
-            return node.data
-        return None
+        path, is_file = self._cursor_entry()
+        return path if is_file else None
 
     def _rel(self, path: Path) -> str:
         """Relative posix string from config_dir."""
-        if self.config_dir:
-            try:
-                return path.relative_to(self.config_dir).as_posix()
-            except ValueError:
-                pass
-        return path.name
+        rel = _rel_posix(str(self.config_dir), str(path)) if self.config_dir else None
+        return path.name if rel is None else rel
+
+    def _in_worker(self, handler: Callable[[Any], Awaitable[None]]) -> Callable[[Any], None]:
+        """Wrap an async modal callback so the file operation runs as a worker, off the UI loop."""
+        return lambda result: self.run_worker(handler(result), group="file-ops")
 
     # ------------------------------------------------------------------
     # Actions
@@ -493,37 +836,27 @@ class FileBrowser(Vertical):
             return
 
         focused_dir = self._focused_dir() or self.config_dir
-        try:
-            rel = focused_dir.relative_to(self.config_dir).as_posix()
-            default_prefix = "" if rel == "." else rel.rstrip("/") + "/"
-        except ValueError:
-            default_prefix = ""
+        rel = _rel_posix(str(self.config_dir), str(focused_dir))
+        default_prefix = "" if rel is None or rel == "." else rel.rstrip("/") + "/"
 
         config_dir = self.config_dir
 
-        def handle_new_file(filename: str | None) -> None:
+        async def handle_new_file(filename: str | None) -> None:
             if not filename:
                 return
-            if not filename.endswith(".yaml") and not filename.endswith(".yml"):
-                filename += ".yaml"
+            filename = _ensure_yaml(filename)
             target_path = config_dir / filename
             try:
-                if target_path.exists():
-                    self.app.notify(f"File already exists: {filename}", severity="warning")
-                    return
-                self._suppress_watch = True
-                try:
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    target_path.write_text("")
-                finally:
-                    self._suppress_watch = False
-                self.app.notify(f"Created {filename}")
-                self.refresh_tree()
-                self.post_message(self.FileListChanged())
+                self._mark_self_edit(target_path)
+                await asyncio.to_thread(_create_file, target_path)
+                self._queue_notify(f"Created {filename}")
+                self._schedule_refresh()
+            except _DestinationExists:
+                self._queue_notify(f"File already exists: {filename}", severity="warning")
             except Exception as e:
                 self.app.notify(f"Failed to create file: {e}", severity="error")
 
-        self.app.push_screen(NewFileModal(default_prefix=default_prefix), handle_new_file)
+        self.app.push_screen(NewFileModal(default_prefix=default_prefix), self._in_worker(handle_new_file))
 
     def action_delete_file(self) -> None:
         if not self.config_dir:
@@ -534,25 +867,19 @@ class FileBrowser(Vertical):
             self.app.notify("Please select a file to delete", severity="warning")
             return
 
-        config_dir = self.config_dir
-
-        def handle_delete(confirm: bool | None) -> None:
+        async def handle_delete(confirm: bool | None) -> None:
             if confirm:
                 try:
-                    self._suppress_watch = True
-                    try:
-                        target_path.unlink()
-                    finally:
-                        self._suppress_watch = False
-                    self.app.notify(f"Deleted {target_path.name}")
-                    self.refresh_tree()
-                    self.post_message(self.FileListChanged())
+                    self._mark_self_edit(target_path)
+                    await asyncio.to_thread(target_path.unlink)
+                    self._queue_notify(f"Deleted {target_path.name}")
+                    self._schedule_refresh()
                 except Exception as e:
                     self.app.notify(f"Failed to delete file: {e}", severity="error")
 
         self.app.push_screen(
-            DeleteFileConfirmModal(target_path.relative_to(config_dir).as_posix()),
-            handle_delete,
+            DeleteFileConfirmModal(self._rel(target_path)),
+            self._in_worker(handle_delete),
         )
 
     def action_rename_file(self) -> None:
@@ -564,28 +891,22 @@ class FileBrowser(Vertical):
             self.app.notify("Please select a file to rename", severity="warning")
             return
 
-        def handle_rename(new_name: str | None) -> None:
+        async def handle_rename(new_name: str | None) -> None:
             if not new_name:
                 return
-            if not new_name.endswith(".yaml") and not new_name.endswith(".yml"):
-                new_name += ".yaml"
+            new_name = _ensure_yaml(new_name)
             dest = target_path.parent / new_name
-            if dest.exists():
-                self.app.notify(f"File already exists: {new_name}", severity="warning")
-                return
             try:
-                self._suppress_watch = True
-                try:
-                    target_path.rename(dest)
-                finally:
-                    self._suppress_watch = False
-                self.app.notify(f"Renamed to {new_name}")
-                self.refresh_tree()
-                self.post_message(self.FileListChanged())
+                self._mark_self_edit(target_path, dest)
+                await asyncio.to_thread(_move_file, target_path, dest)
+                self._queue_notify(f"Renamed to {new_name}")
+                self._schedule_refresh()
+            except _DestinationExists:
+                self._queue_notify(f"File already exists: {new_name}", severity="warning")
             except Exception as e:
                 self.app.notify(f"Failed to rename: {e}", severity="error")
 
-        self.app.push_screen(RenameFileModal(target_path.name), handle_rename)
+        self.app.push_screen(RenameFileModal(target_path.name), self._in_worker(handle_rename))
 
     def action_copy_file(self) -> None:
         if not self.config_dir:
@@ -598,29 +919,22 @@ class FileBrowser(Vertical):
 
         config_dir = self.config_dir
 
-        def handle_copy(dest_rel: str | None) -> None:
+        async def handle_copy(dest_rel: str | None) -> None:
             if not dest_rel:
                 return
-            if not dest_rel.endswith(".yaml") and not dest_rel.endswith(".yml"):
-                dest_rel += ".yaml"
+            dest_rel = _ensure_yaml(dest_rel)
             dest = config_dir / dest_rel
-            if dest.exists():
-                self.app.notify(f"File already exists: {dest_rel}", severity="warning")
-                return
             try:
-                self._suppress_watch = True
-                try:
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(target_path, dest)
-                finally:
-                    self._suppress_watch = False
-                self.app.notify(f"Copied to {dest_rel}")
-                self.refresh_tree()
-                self.post_message(self.FileListChanged())
+                self._mark_self_edit(dest)
+                await asyncio.to_thread(_copy_file, target_path, dest)
+                self._queue_notify(f"Copied to {dest_rel}")
+                self._schedule_refresh()
+            except _DestinationExists:
+                self._queue_notify(f"File already exists: {dest_rel}", severity="warning")
             except Exception as e:
                 self.app.notify(f"Failed to copy: {e}", severity="error")
 
-        self.app.push_screen(CopyFileModal(self._rel(target_path)), handle_copy)
+        self.app.push_screen(CopyFileModal(self._rel(target_path)), self._in_worker(handle_copy))
 
     def action_move_file(self) -> None:
         if not self.config_dir:
@@ -633,26 +947,19 @@ class FileBrowser(Vertical):
 
         config_dir = self.config_dir
 
-        def handle_move(dest_rel: str | None) -> None:
+        async def handle_move(dest_rel: str | None) -> None:
             if not dest_rel:
                 return
-            if not dest_rel.endswith(".yaml") and not dest_rel.endswith(".yml"):
-                dest_rel += ".yaml"
+            dest_rel = _ensure_yaml(dest_rel)
             dest = config_dir / dest_rel
-            if dest.exists():
-                self.app.notify(f"File already exists: {dest_rel}", severity="warning")
-                return
             try:
-                self._suppress_watch = True
-                try:
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(target_path), dest)
-                finally:
-                    self._suppress_watch = False
-                self.app.notify(f"Moved to {dest_rel}")
-                self.refresh_tree()
-                self.post_message(self.FileListChanged())
+                self._mark_self_edit(target_path, dest)
+                await asyncio.to_thread(_move_file, target_path, dest)
+                self._queue_notify(f"Moved to {dest_rel}")
+                self._schedule_refresh()
+            except _DestinationExists:
+                self._queue_notify(f"File already exists: {dest_rel}", severity="warning")
             except Exception as e:
                 self.app.notify(f"Failed to move: {e}", severity="error")
 
-        self.app.push_screen(MoveFileModal(self._rel(target_path)), handle_move)
+        self.app.push_screen(MoveFileModal(self._rel(target_path)), self._in_worker(handle_move))
@@ -21,16 +21,27 @@
 # SPDX-License-Identifier: MIT
 
 import time
+from collections import defaultdict
 from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.widgets import Button, Input, Label, Select, Static, Tree
+from textual.widgets.tree import TreeNode
 
 from hydra_viewer.core.parser import ConfigModule
 
 _NO_EDIT_GROUPS = {"_self_", "override _self_"}
+_DOUBLE_CLICK_NS = 600_000_000  # second select on the same module within 0.6 s
+
+
+def _options_key(options: list[tuple[str, str | Path]]) -> tuple[tuple[str, str], ...]:
+    return tuple((name, p if isinstance(p, str) else str(p)) for name, p in options)
+
+
+def _leaf_label(name: str, resolved: bool) -> str:
+    return name if resolved else f"{name} ⚠"
 
 
 class ModuleTree(Vertical):
@@ -133,12 +144,20 @@ class ModuleTree(Vertical):
     ):
         super().__init__(**kwargs)
         self.modules = modules
+        self._index_modules()
         self.org_files: list[Path] = org_files or []
         self.current_org = current_org
 
         self._last_selected: ConfigModule | None = None
-        self._last_select_time: float = 0.0
+        self._double_click_deadline_ns: int = 0
         self._editing_module: ConfigModule | None = None
+        # (group, name) -> leaf and group -> group node, for incremental refreshes.
+        self._node_index: dict[tuple[str, str], TreeNode] = {}  # type: ignore[type-arg]
+        self._group_nodes: dict[str, TreeNode] = {}  # type: ignore[type-arg]
+        # (options, tuple(org_files)) from the last _build_select_options call.
+        self._select_options_cache: tuple[list[tuple[str, str | Path]], tuple[Path, ...]] | None = None
+        # Options last handed to the Select, so unchanged lists skip set_options.
+        self._last_select_options_key: tuple[tuple[str, str], ...] | None = None
 
     # ------------------------------------------------------------------ #
     # Compose & build                                                      #
@@ -148,6 +167,7 @@ class ModuleTree(Vertical):
         # Using Static for header-like appearance but customizable
         yield Static("Config Tree", id="org-select-label")
         options = self._build_select_options()
+        self._last_select_options_key = _options_key(options)
         yield Select(options, id="org-select", allow_blank=False)
         yield Input(placeholder="Enter filename manually...", id="org-input")
         yield Tree("Config Modules", id="module-tree")
@@ -167,8 +187,14 @@ class ModuleTree(Vertical):
     # ------------------------------------------------------------------ #
 
     def _build_select_options(self) -> list[tuple[str, str | Path]]:
+        # Keyed on the paths themselves: there are only a handful of root files.
+        key = tuple(self.org_files)
+        cache = self._select_options_cache
+        if cache is not None and cache[1] == key:
+            return cache[0]
         options: list[tuple[str, str | Path]] = [(p.name, p) for p in self.org_files]
         options.append(("Manual Input...", "MANUAL"))
+        self._select_options_cache = (options, key)
         return options
 
     def _update_select(self) -> None:
@@ -182,7 +208,10 @@ class ModuleTree(Vertical):
         # being misinterpreted as user changes, which would cause an infinite
         # org-file switching loop.
         with self.prevent(Select.Changed):
-            sel.set_options(options)
+            key = _options_key(options)
+            if key != self._last_select_options_key:
+                sel.set_options(options)
+                self._last_select_options_key = key
 
             if self.current_org and self.current_org in self.org_files:
                 sel.value = self.current_org
@@ -203,24 +232,89 @@ class ModuleTree(Vertical):
     def _rebuild_tree(self) -> None:
         tree = self.query_one("#module-tree", Tree)
         tree.clear()
+        self._node_index.clear()
+        self._group_nodes.clear()
         tree.root.expand()
         self._build_tree(tree)
 
+    def _index_modules(self) -> None:
+        """Parallel per-field tuples of self.modules for the tree-building loops."""
+        self._groups: tuple[str, ...] = tuple(m.group for m in self.modules)
+        self._names: tuple[str, ...] = tuple(m.name for m in self.modules)
+        self._resolved: tuple[bool, ...] = tuple(m.resolved for m in self.modules)
+
+    def _group_indices(self) -> defaultdict[str, list[int]]:
+        groups: defaultdict[str, list[int]] = defaultdict(list)
+        for i, group in enumerate(self._groups):
+            groups[group].append(i)
+        return groups
+
     def _build_tree(self, tree: Tree) -> None:  # type: ignore[type-arg]
-        groups: dict[str, list[ConfigModule]] = {}
-        for m in self.modules:
-            group_key = m.group
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(m)
-
-        for group_name, mods in sorted(groups.items()):
+        modules, names, resolved = self.modules, self._names, self._resolved
+        groups = self._group_indices()
+        for group_name in sorted(groups):
             group_node = tree.root.add(group_name, expand=True)
-            for m in mods:
-                label = f"{m.name}"
-                if not m.resolved:
-                    label += " ⚠"
-                group_node.add_leaf(label, data=m)
+            self._group_nodes[group_name] = group_node
+            for i in groups[group_name]:
+                leaf = group_node.add_leaf(_leaf_label(names[i], resolved[i]), data=modules[i])
+                self._node_index[(group_name, names[i])] = leaf
+
+    def _patch_tree(self, tree: Tree) -> bool:  # type: ignore[type-arg]
+        """
+        Bring the existing tree in line with self.modules, touching only nodes
+        that changed; returns False when a full rebuild is the better option.
+        """
+        modules, names, resolved = self.modules, self._names, self._resolved
+        by_group = self._group_indices()
+        new_keys = set(zip(self._groups, names, strict=True))
+        if len(new_keys) != len(self.modules):
+            return False  # duplicate entries cannot be keyed
+        old_keys = set(self._node_index)
+        if len(old_keys ^ new_keys) > len(self.modules) // 2:
+            return False
+
+        # Surviving leaves must keep their relative order; a reorder is rebuilt.
+        for group_name, idxs in by_group.items():
+            group_node = self._group_nodes.get(group_name)
+            if group_node is None:
+                continue
+            current = [(group_name, c.data.name) for c in group_node.children if (group_name, c.data.name) in new_keys]
+            if current != [(group_name, names[i]) for i in idxs if (group_name, names[i]) in old_keys]:
+                return False
+
+        for key in old_keys - new_keys:
+            self._node_index.pop(key).remove()
+        for group_name in [g for g in self._group_nodes if g not in by_group]:
+            self._group_nodes.pop(group_name).remove()
+
+        for group_name in sorted(by_group):
+            group_node = self._group_nodes.get(group_name)
+            if group_node is None:
+                later = [g for g in self._group_nodes if g > group_name]
+                before = self._group_nodes[min(later)] if later else None
+                group_node = tree.root.add(group_name, expand=True, before=before)
+                self._group_nodes[group_name] = group_node
+            idxs = by_group[group_name]
+            for pos, i in enumerate(idxs):
+                key = (group_name, names[i])
+                label = _leaf_label(names[i], resolved[i])
+                node = self._node_index.get(key)
+                if node is not None:
+                    node.data = modules[i]
+                    if str(node.label) != label:
+                        node.set_label(label)
+                    continue
+                # Insert ahead of the next leaf in this group that is already shown.
+                before = next(
+                    (
+                        self._node_index[(group_name, names[j])]
+                        for j in idxs[pos + 1 :]
+                        if (group_name, names[j]) in self._node_index
+                    ),
+                    None,
+                )
+                self._node_index[key] = group_node.add_leaf(label, data=modules[i], before=before)
+        return True
 
     def _is_editable(self, module: ConfigModule) -> bool:
         if module.group in _NO_EDIT_GROUPS:
@@ -240,11 +334,15 @@ class ModuleTree(Vertical):
         current_org: Path | None = None,
     ) -> None:
         self.modules = new_modules
+        self._index_modules()
         if org_files is not None:
             self.org_files = org_files
+            self._select_options_cache = None
         if current_org is not None:
             self.current_org = current_org
-        self._rebuild_tree()
+        tree = self.query_one("#module-tree", Tree)
+        if not self._node_index or not self._patch_tree(tree):
+            self._rebuild_tree()
         self._update_select()
 
     # ------------------------------------------------------------------ #
@@ -258,8 +356,8 @@ class ModuleTree(Vertical):
 
         self.post_message(self.ModuleSelected(module))
 
-        now = time.monotonic()
-        if module is self._last_selected and (now - self._last_select_time) < 0.6:
+        now_ns = time.monotonic_ns()
+        if module is self._last_selected and now_ns < self._double_click_deadline_ns:
             # Double-click detected
             if self._is_editable(module):
                 self._start_edit(module)
@@ -267,7 +365,7 @@ class ModuleTree(Vertical):
                 self.app.notify("This entry cannot be edited.", severity="warning")
         else:
             self._last_selected = module
-            self._last_select_time = now
+            self._double_click_deadline_ns = now_ns + _DOUBLE_CLICK_NS
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id != "org-select":
@@ -340,11 +438,12 @@ class ModuleTree(Vertical):
         inp = self.query_one("#edit-input", Input)
         raw = inp.value.strip()
 
-        if "/" not in raw:
+        parts = raw.rsplit("/", 1)
+        if len(parts) != 2:
             self.app.notify("Format must be group/name", severity="error")
             return
 
-        new_group, new_name = raw.rsplit("/", 1)
+        new_group, new_name = parts
         if not new_group or not new_name:
             self.app.notify("Both group and name must be non-empty", severity="error")
             return
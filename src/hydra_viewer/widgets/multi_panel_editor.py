@@ -22,7 +22,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+from pathlib import Path, PureWindowsPath
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -35,6 +36,26 @@ from hydra_viewer.core.parser import ConfigModule
 _LINES_THRESHOLD = 50
 _TITLE_ROWS = 2  # 1 label + 1 border row budgeted
 _MIN_TEXTAREA_ROWS = 3
+_EST_BYTES_PER_LINE = 24  # placeholder sizing for panes not loaded yet
+
+
+def _tail_path(path: Path) -> str:
+    """Last two path parts as a title hint, e.g. ``.../db/mysql.yaml``."""
+    slash_separator = "\\" if isinstance(path, PureWindowsPath) else "/"
+    return f"...{slash_separator}{Path(*path.parts[-2:])}"
+
+
+def _disk_key(path: Path) -> tuple[Path, int] | None:
+    """(path, mtime_ns) identifying the on-disk version of *path*, or None if it is gone."""
+    try:
+        return path, path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _line_count(s: str) -> int:
+    """Same as ``len(s.splitlines())`` for ``\n`` text, without building the list."""
+    return s.count("\n") + (1 if s and not s.endswith("\n") else 0)
 
 
 class _ConfirmReplaceModal(ModalScreen[bool]):
@@ -109,45 +130,73 @@ class FilePane(Vertical):
         super().__init__(**kwargs)
         self.file_path = path
         self.display_name = display_name
-        self._original_content = content
+        self._set_original(content)
         self._content = content
+        self._content_line_count = _line_count(content)
+        self._last_dirty = False
+        self._loaded = True
+        self._save_lock = asyncio.Lock()
+        # Disk version the buffer was loaded from; reload() skips the read while it is unchanged.
+        self._disk_key = _disk_key(path)
+        self._cache_titles()
 
     def compose(self) -> ComposeResult:
-        yield Label(self._make_title(), id="pane-title", markup=False)
-        lines = len(self._content.splitlines()) or 1
+        # Keep references so keystroke handlers never go through query_one.
+        self._title_label = Label(self._make_title(), id="pane-title", markup=False)
+        yield self._title_label
+        yield self._build_textarea()
+
+    def on_mount(self) -> None:
+        if self._loaded:
+            self._update_height()
+
+    def _build_textarea(self) -> TextArea:
+        lines = self._content_line_count or 1
         ta_height = min(lines, _LINES_THRESHOLD) + 3  # Match _update_height buffer
-        ta = TextArea(
+        self._textarea = TextArea(
             self._content,
             language="yaml",
             id="pane-textarea",
         )
-        ta.show_line_numbers = True  # helpful for code
-        ta.styles.height = ta_height
-        yield ta
-
-    def on_mount(self) -> None:
-        self._update_height()
+        self._textarea.show_line_numbers = True  # helpful for code
+        self._textarea.styles.height = ta_height
+        return self._textarea
 
     def _make_title(self, dirty: bool = False) -> str:
+        return self._title_dirty if dirty else self._title_clean
+
+    def _build_title(self, dirty: bool) -> str:
         # Request 5: Filename without suffix + relative path hint
         # Refactored for user request: Use display_name (group name) if available
         name_part = self.display_name or self.file_path.stem
-
-        # Try to show tail path as context
-        from pathlib import PureWindowsPath, WindowsPath
-
-        if isinstance(self.file_path, WindowsPath) or isinstance(self.file_path, PureWindowsPath):
-            slash_separator = "\\"
-        else:
-            slash_separator = "/"
-        tail_path = f"...{slash_separator}{Path(*self.file_path.parts[-2:])}"
-        content = f"{name_part} ({tail_path})"
+        content = f"{name_part} ({self._tail_path_str})"
 
         marker = " *" if dirty else ""
         return f" {content}{marker}"
 
+    def _cache_titles(self) -> None:
+        """Build both title variants once; call again whenever file_path changes."""
+        self._tail_path_str = _tail_path(self.file_path)
+        self._title_clean = self._build_title(dirty=False)
+        self._title_dirty = self._build_title(dirty=True)
+
+    def _set_original(self, text: str) -> None:
+        """Record *text* as the saved state that dirtiness is measured against."""
+        self._original_content = text
+        self._original_len = len(text)
+
+    def _differs(self, text: str) -> bool:
+        # Most edits change the length, which settles it without comparing contents.
+        return len(text) != self._original_len or text != self._original_content
+
+    def _mark_dirty(self, dirty: bool) -> None:
+        """Repaint the title only when the dirty marker actually flips."""
+        if dirty != self._last_dirty:
+            self._last_dirty = dirty
+            self._title_label.update(self._make_title(dirty))
+
     def _update_height(self) -> None:
-        lines = len(self._content.splitlines()) or 1
+        lines = self._content_line_count or 1
         # Fix for Issue 1: Ensure enough height when lines < threshold
         # TextArea needs slightly more space so it doesn't scroll small content.
         # Add buffer of 2 lines to capped height just to be safe for TextArea vertical padding/scrollbar reservation.
@@ -156,41 +205,107 @@ class FilePane(Vertical):
 
         total = textarea_height + _TITLE_ROWS
         self.styles.height = total
-        ta = self.query_one("#pane-textarea", TextArea)
-        ta.styles.height = textarea_height
+        self._textarea.styles.height = textarea_height
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        ta = self.query_one("#pane-textarea", TextArea)
-        dirty = ta.text != self._original_content
-        title = self.query_one("#pane-title", Label)
-        title.update(self._make_title(dirty=dirty))
+        self._mark_dirty(self._differs(self._textarea.text))
 
     @property
     def is_dirty(self) -> bool:
         try:
-            return self.query_one("#pane-textarea", TextArea).text != self._original_content
-        except Exception:
+            return self._differs(self._textarea.text)
+        except AttributeError:  # not composed yet
             return False
 
     def get_text(self) -> str:
-        return self.query_one("#pane-textarea", TextArea).text
+        return self._textarea.text
+
+    async def save(self) -> None:
+        # The write runs in a thread; the lock keeps overlapping saves (auto-save
+        # plus Ctrl+S) from interleaving their truncate/write on the same file.
+        async with self._save_lock:
+            text = self.get_text()
+            await asyncio.to_thread(self.file_path.write_text, text, encoding="utf-8")
+            self._disk_key = _disk_key(self.file_path)
+            self._set_original(text)
+            # Typing may have continued while the write was in flight.
+            self._mark_dirty(self._differs(self.get_text()))
 
-    def save(self) -> None:
-        text = self.get_text()
-        self.file_path.write_text(text, encoding="utf-8")
-        self._original_content = text
-        title = self.query_one("#pane-title", Label)
-        title.update(self._make_title(dirty=False))
+    def reload(self) -> None:
+        key = _disk_key(self.file_path)
+        if key is None:
+            return
+        # Same file, untouched on disk and no local edits to discard: nothing to do.
+        if key == self._disk_key and not self.is_dirty:
+            return
+        self._disk_key = key
+        self._content = self.file_path.read_text(encoding="utf-8")
+        self._content_line_count = _line_count(self._content)
+        self._set_original(self._content)
+        self._textarea.text = self._content
+        self._update_height()
+        # file_path may have been swapped (ExtraFilePane reuse): rebuild titles.
+        self._cache_titles()
+        self._last_dirty = False
+        self._title_label.update(self._make_title())
+
+
+class LazyFilePane(FilePane):
+    """
+    A FilePane that reads its file and builds the TextArea only once it comes
+    into view; until then it is a title bar over a placeholder sized from the
+    file size. Unloaded panes are never dirty and skip reload.
+    """
+
+    class Placed(Message):
+        """Layout gave an unloaded pane its size, so its visibility can be judged."""
+
+    def __init__(self, path: Path, display_name: str | None = None, **kwargs):
+        super().__init__(path, "", display_name=display_name, **kwargs)
+        self._loaded = False
+
+    def compose(self) -> ComposeResult:
+        self._title_label = Label(self._make_title(), id="pane-title", markup=False)
+        yield self._title_label
+
+    def on_mount(self) -> None:
+        if self._loaded:
+            return
+        # Estimated height keeps the scroll extent close to its final size.
+        try:
+            size = self.file_path.stat().st_size
+        except OSError:
+            size = 0
+        lines = min(size // _EST_BYTES_PER_LINE + 1, _LINES_THRESHOLD)
+        self.styles.height = lines + 3 + _TITLE_ROWS
+
+    def on_resize(self) -> None:
+        if not self._loaded:
+            self.post_message(self.Placed())
+
+    def load(self) -> None:
+        """Read the file and mount the editor; no-op once loaded."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._disk_key = _disk_key(self.file_path)
+        try:
+            content = self.file_path.read_text(encoding="utf-8")
+        except Exception as e:
+            content = f"# Error reading file: {e}"
+        self._content = content
+        self._set_original(content)
+        self._content_line_count = _line_count(content)
+        self.mount(self._build_textarea())
+        self._update_height()
+
+    def get_text(self) -> str:
+        self.load()
+        return super().get_text()
 
     def reload(self) -> None:
-        if self.file_path.exists():
-            self._content = self.file_path.read_text(encoding="utf-8")
-            self._original_content = self._content
-            ta = self.query_one("#pane-textarea", TextArea)
-            ta.text = self._content
-            self._update_height()
-            title = self.query_one("#pane-title", Label)
-            title.update(self._make_title(dirty=False))
+        if self._loaded:
+            super().reload()
 
 
 class ExtraFilePane(FilePane):
@@ -216,18 +331,10 @@ class ExtraFilePane(FilePane):
     }
     """
 
-    def _make_title(self, dirty: bool = False) -> str:
+    def _build_title(self, dirty: bool) -> str:
         marker = " *" if dirty else ""
-        from pathlib import PureWindowsPath, WindowsPath
-
-        if isinstance(self.file_path, WindowsPath) or isinstance(self.file_path, PureWindowsPath):
-            slash_separator = "\\"
-        else:
-            slash_separator = "/"
-        path_str = f"...{slash_separator}{Path(*self.file_path.parts[-2:])}"
-
         prefix = f"[External]{marker}"
-        return f" {prefix}  {path_str}"
+        return f" {prefix}  {self._tail_path_str}"
 
 
 class MultiPanelEditor(Vertical):
@@ -261,6 +368,11 @@ class MultiPanelEditor(Vertical):
         super().__init__(**kwargs)
         self._module_paths: list[Path] = []  # track defaults-derived panes by path
         self._extra_path: Path | None = None
+        self._visibility_check_pending = False
+        # Module panes in display order plus a path index, so lookups skip DOM queries.
+        self._module_panes: list[FilePane] = []
+        self._pane_index: dict[Path, FilePane] = {}
+        self._extra_pane: ExtraFilePane | None = None
 
     # ------------------------------------------------------------------ #
     # Compose                                                              #
@@ -269,6 +381,20 @@ class MultiPanelEditor(Vertical):
     def compose(self) -> ComposeResult:
         yield VerticalScroll(id="panel-scroller")
 
+    def on_mount(self) -> None:
+        scroller = self.query_one("#panel-scroller", VerticalScroll)
+        self.watch(scroller, "scroll_y", self._load_visible_panes, init=False)
+
+    def on_resize(self) -> None:
+        self._load_visible_panes()
+
+    def on_lazy_file_pane_placed(self, event: LazyFilePane.Placed) -> None:
+        event.stop()
+        # Many panes are placed in one layout pass; check them all once afterwards.
+        if not self._visibility_check_pending:
+            self._visibility_check_pending = True
+            self.call_after_refresh(self._load_visible_panes)
+
     # ------------------------------------------------------------------ #
     # Public API                                                           #
     # ------------------------------------------------------------------ #
@@ -277,19 +403,15 @@ class MultiPanelEditor(Vertical):
         """Rebuild panes from a list of ConfigModule (defaults order)."""
         scroller = self.query_one("#panel-scroller", VerticalScroll)
 
-        # Remove all existing module panes (not ExtraFilePane) and placeholder labels.
-        # Do NOT use IDs on new panes to avoid DuplicateIds when the old removal
-        # is still being processed by the event queue.
-        for child in list(scroller.children):
-            if not isinstance(child, ExtraFilePane):
-                child.remove()
-
         self._module_paths = []
+        self._module_panes = []
+        self._pane_index = {}
 
+        widgets: list[Label | FilePane] = []
         for m in modules:
             if not m.resolved or not m.path:
                 # Show a placeholder label
-                scroller.mount(
+                widgets.append(
                     Label(
                         f"  ⚠ Unresolved: {m.group}/{m.name}",
                         classes="unresolved-placeholder",
@@ -297,14 +419,20 @@ class MultiPanelEditor(Vertical):
                 )
                 continue
 
-            try:
-                content = m.path.read_text(encoding="utf-8")
-            except Exception as e:
-                content = f"# Error reading file: {e}"
-
-            pane = FilePane(m.path, content, display_name=m.display_name)  # Pass display_name (group)
-            scroller.mount(pane)
+            # Files are read when their pane scrolls into view (_load_visible_panes).
+            pane = LazyFilePane(m.path, display_name=m.display_name)  # Pass display_name (group)
+            widgets.append(pane)
             self._module_paths.append(m.path)
+            self._module_panes.append(pane)
+            self._pane_index.setdefault(m.path, pane)
+
+        # Swap old for new in one removal and one mount so the screen lays out once.
+        # Remove all existing module panes (not ExtraFilePane) and placeholder labels.
+        # Do NOT use IDs on new panes to avoid DuplicateIds when the old removal
+        # is still being processed by the event queue.
+        with self.app.batch_update():
+            scroller.remove_children([c for c in scroller.children if not isinstance(c, ExtraFilePane)])
+            scroller.mount_all(widgets)
 
     def open_extra_file(self, path: Path) -> None:
         """Open a file that is not in the defaults list in the ExtraFilePane."""
@@ -320,23 +448,23 @@ class MultiPanelEditor(Vertical):
         else:
             self._load_extra(path)
 
-    def save_all(self) -> None:
+    async def save_all(self) -> None:
         """Save all open panes (both module panes and ExtraFilePane)."""
-        for pane in self.query(FilePane):
+        for pane in self._all_panes():
             if pane.is_dirty:
                 try:
-                    pane.save()
+                    await pane.save()
                     self.post_message(self.FileSaved(pane.file_path))
                     self.app.notify(f"Saved {pane.file_path.name}")
                 except Exception as e:
                     self.app.notify(f"Error saving {pane.file_path.name}: {e}", severity="error")
 
-    def save_pane(self, path: Path) -> None:
+    async def save_pane(self, path: Path) -> None:
         """Save the pane for a specific file path."""
         pane = self._find_pane(path)
         if pane and pane.is_dirty:
             try:
-                pane.save()
+                await pane.save()
                 self.post_message(self.FileSaved(path))
                 self.app.notify(f"Saved {path.name}")
             except Exception as e:
@@ -344,16 +472,18 @@ class MultiPanelEditor(Vertical):
 
     def reload_all(self) -> None:
         """Reload all open panes from disk."""
-        for pane in self.query(FilePane):
+        for pane in self._all_panes():
             pane.reload()
 
     def scroll_to_path(self, path: Path) -> None:
         """Scroll to the pane associated with the given path."""
         pane = self._find_pane(path)
         if pane:
+            if isinstance(pane, LazyFilePane):
+                pane.load()
             pane.scroll_visible()
 
-    def save_current_file(self, *, silent: bool = False) -> None:
+    async def save_current_file(self, *, silent: bool = False) -> None:
         """Save whichever pane currently has focus (compatible shim for app.py)."""
         focused = self.app.focused
         # Walk up from focused widget to find FilePane
@@ -361,7 +491,7 @@ class MultiPanelEditor(Vertical):
         while widget is not None:
             if isinstance(widget, FilePane):
                 try:
-                    widget.save()
+                    await widget.save()
                     self.post_message(self.FileSaved(widget.file_path))
                     if not silent:
                         self.app.notify(f"Saved {widget.file_path.name}")
@@ -378,19 +508,37 @@ class MultiPanelEditor(Vertical):
     # Internal helpers                                                     #
     # ------------------------------------------------------------------ #
 
-    @staticmethod
-    def _pane_id(path: Path) -> str:
-        return "filepane-" + path.as_posix().replace("/", "-").replace(".", "-").replace(":", "-")
+    def _all_panes(self) -> list[FilePane]:
+        """Extra pane (if any) then module panes, i.e. top-to-bottom order."""
+        if self._extra_pane is None:
+            return self._module_panes
+        return [self._extra_pane, *self._module_panes]
 
     def _find_pane(self, path: Path) -> FilePane | None:
-        for pane in self.query(FilePane):
-            if pane.file_path == path:
-                return pane
-        return None
+        if self._extra_pane is not None and self._extra_pane.file_path == path:
+            return self._extra_pane
+        return self._pane_index.get(path)
 
     def _get_extra_pane(self) -> ExtraFilePane | None:
-        panes = list(self.query(ExtraFilePane))
-        return panes[0] if panes else None
+        return self._extra_pane
+
+    def _load_visible_panes(self) -> None:
+        """Load every LazyFilePane within one screen of the visible part of the scroller."""
+        self._visibility_check_pending = False
+        scroller = self.query_one("#panel-scroller", VerticalScroll)
+        height = scroller.scrollable_content_region.height
+        top = scroller.scroll_y - height
+        bottom = scroller.scroll_y + 2 * height
+        loaded_any = False
+        for pane in scroller.children:
+            if isinstance(pane, LazyFilePane) and not pane._loaded:
+                region = pane.virtual_region
+                if region and region.y < bottom and region.bottom > top:
+                    pane.load()
+                    loaded_any = True
+        if loaded_any:
+            # Real heights differ from the estimates; check again after layout.
+            self.call_after_refresh(self._load_visible_panes)
 
     def _load_extra(self, path: Path) -> None:
         try:
@@ -403,11 +551,12 @@ class MultiPanelEditor(Vertical):
 
         if existing:
             existing.file_path = path
-            existing._original_content = content
+            existing._set_original(content)
             existing._content = content
             existing.reload()
         else:
             extra = ExtraFilePane(path, content, id="extra-file-pane")
+            self._extra_pane = extra
             scroller.mount(extra, before=scroller.children[0] if scroller.children else None)
 
         self._extra_path = path
@@ -421,6 +570,6 @@ class MultiPanelEditor(Vertical):
             scroller = self.query_one("#panel-scroller", VerticalScroll)
             scroller.scroll_home(animate=False)
             try:
-                extra.query_one("#pane-textarea", TextArea).focus()
-            except Exception:
+                extra._textarea.focus()
+            except AttributeError:
                 pass
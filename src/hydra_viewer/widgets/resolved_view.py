@@ -53,20 +53,34 @@ class ResolvedView(Static):
 
     text = reactive("")
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Background only changes when the error state flips.
+        self._last_error_state: bool | None = None
+        # What the TextArea currently shows; re-assigning it re-highlights everything.
+        self._last_content = ""
+
     def compose(self) -> ComposeResult:
         # Read-only TextArea
         yield Static("Resolved Configuration", id="resolved-header")
-        yield TextArea(self.text, language="yaml", show_line_numbers=True, read_only=True, id="resolved-text")
+        self._text_area = TextArea(
+            self.text, language="yaml", show_line_numbers=True, read_only=True, id="resolved-text"
+        )
+        self._last_content = self.text
+        yield self._text_area
 
     def update_content(self, new_content: str) -> None:
         self.text = new_content
         try:
-            text_area = self.query_one(TextArea)
-            text_area.text = new_content
-            # rudimentary error highlighting check
-            if new_content.startswith("# Error"):
-                text_area.styles.background = "#330000"
-            else:
-                text_area.styles.background = "$surface"
-        except Exception:
-            pass
+            text_area = self._text_area
+        except AttributeError:  # not composed yet
+            return
+        if new_content == self._last_content:  # str == compares lengths first
+            return
+        self._last_content = new_content
+        text_area.text = new_content
+        # rudimentary error highlighting check
+        is_error = new_content.startswith("# Error")
+        if is_error != self._last_error_state:
+            text_area.styles.background = "#330000" if is_error else "$surface"
+            self._last_error_state = is_error
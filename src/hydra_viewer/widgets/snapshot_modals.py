@@ -108,9 +108,17 @@ class RestoreModal(ModalScreen[Path]):
     }
     """
 
+    # Rows added on open and per scroll-to-bottom; long backup histories stay quick to open.
+    PAGE_SIZE = 200
+
     def __init__(self, snapshot_manager: SnapshotManager):
         super().__init__()
         self.manager = snapshot_manager
+        self._rows: list[tuple[str, float, str]] = []
+        self._offset = 0
+        self._fmt_cache: dict[int, str] = {}
+        # Path per table row, in row order; Restore hands back the prebuilt object.
+        self._row_paths: list[Path] = []
 
     def compose(self) -> ComposeResult:
         with Vertical(id="dialog"):
@@ -125,12 +133,38 @@ class RestoreModal(ModalScreen[Path]):
         table.cursor_type = "row"
         table.add_columns("Tag", "Date", "Path")
 
-        snapshots = self.manager.list_snapshots()
-        for snap in snapshots:
-            ts = snap.get("timestamp", 0)
-            date_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
-            row_key = snap.get("path")
-            table.add_row(snap.get("tag"), date_str, row_key, key=row_key)
+        self._rows = self.manager.snapshot_rows()
+        self._offset = 0
+        self._add_page(table)
+        self.watch(table, "scroll_y", self._on_table_scroll, init=False)
+
+    def _add_page(self, table: DataTable) -> None:
+        """Append the next PAGE_SIZE snapshots (newest first) to the table."""
+        page = self._rows[self._offset : self._offset + self.PAGE_SIZE]
+        self._offset += len(page)
+        fmt_cache = self._fmt_cache
+        for tag, ts, path in page:
+            # Snapshots taken in the same second share one formatted date.
+            sec = int(ts)
+            date_str = fmt_cache.get(sec)
+            if date_str is None:
+                date_str = fmt_cache[sec] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            table.add_row(tag, date_str, path, key=path)
+            self._row_paths.append(Path(path))
+
+    def _maybe_add_page(self) -> None:
+        if self._offset >= len(self._rows):
+            return
+        table = self.query_one(DataTable)
+        near_end = table.cursor_row >= table.row_count - 1
+        if near_end or table.scroll_y >= table.max_scroll_y - table.scrollable_content_region.height:
+            self._add_page(table)
+
+    def _on_table_scroll(self, _scroll_y: float) -> None:
+        self._maybe_add_page()
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        self._maybe_add_page()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         pass
@@ -138,27 +172,11 @@ class RestoreModal(ModalScreen[Path]):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "restore":
             table = self.query_one(DataTable)
-            if table.cursor_row is not None:
-                try:
-                    # coordinate_to_cell_key might not be available or stable?
-                    # row_key is what we set in add_row(..., key=...).
-                    # get_row_at(index) returns values.
-                    # We can use table.get_row(table.cursor_row) if cursor_row is index.
-                    # But wait, we set explicit key.
-                    # Usually table.get_row_at(cursor_row) returns list of values.
-                    # But we need the Path. We stored it as key.
-                    # Can we get current row key?
-                    # Since Textual 0.29+, cursor_row is index.
-                    # We can iterate or use coordinate.
-                    # Let's rely on coordinate.
-                    coord = table.cursor_coordinate
-                    cell_key = table.coordinate_to_cell_key(coord)
-                    row_key = cell_key.row_key
-                    if row_key and row_key.value:
-                        self.dismiss(Path(row_key.value))
-                        return
-                except Exception:
-                    pass
+            # Rows are appended in order and never re-sorted, so the cursor row indexes _row_paths.
+            row = table.cursor_row
+            if 0 <= row < min(table.row_count, len(self._row_paths)):
+                self.dismiss(self._row_paths[row])
+                return
             self.app.notify("Please select a snapshot", severity="warning")
 
         else:
@@ -20,14 +20,93 @@
 #
 # SPDX-License-Identifier: MIT
 
+import asyncio
+import mmap
+import os
 from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Static, TabbedContent, TabPane, TextArea
 
 from hydra_viewer.core.parser import ConfigModule
 
+# (st_mtime_ns, st_size): identifies the on-disk version of a file.
+_Sig = tuple[int, int]
+
+# Files at least this large are decoded from an mmap rather than a bytes copy.
+_MMAP_THRESHOLD = 1 << 20
+# Larger buffers open without syntax highlighting: tree-sitter re-parses on every edit.
+_HIGHLIGHT_MAX_CHARS = 256_000
+
+
+def _stat_sig(path: Path) -> _Sig:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_with_sig(path: Path) -> tuple[_Sig, str]:
+    """
+    Read *path* as UTF-8 together with its signature, taken from the open descriptor.
+
+    Large files are decoded straight out of an mmap, so the raw bytes never exist as
+    a second heap copy next to the decoded string.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+        else:
+            text = f.read().decode("utf-8")
+    return (st.st_mtime_ns, st.st_size), text
+
+
+def _read_if_changed(path: Path, known: _Sig | None, force: bool) -> tuple[_Sig, str | None] | None:
+    """
+    One stat; the file is read only if its signature moved (or *force*).
+
+    Returns None if the file is gone.
+    """
+    try:
+        sig = _stat_sig(path)
+    except FileNotFoundError:
+        return None
+    if sig == known and not force:
+        return sig, None
+    return _read_with_sig(path)
+
+
+def _write_with_sig(path: Path, content: str) -> _Sig:
+    """
+    Atomically replace *path* with *content* via a sibling temp file and os.replace.
+
+    Readers never see a truncated file. The signature comes from fstat on the temp
+    file, which becomes *path* on rename.
+    """
+    target = os.path.realpath(path)  # replace a symlink's target, not the link
+    tmp = target + ".tmp"
+    try:
+        mode = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    try:
+        with open(tmp, "wb") as f:
+            f.write(content.encode("utf-8"))
+            f.flush()
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            st = os.fstat(f.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return st.st_mtime_ns, st.st_size
+
 
 class YamlEditor(Static):
     BINDINGS = [
@@ -55,6 +134,17 @@ class YamlEditor(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.open_files: dict[str, Path] = {}  # tab_id -> file_path
+        # tab_id -> (disk signature, text) as of the last load or save.
+        self._synced: dict[str, tuple[_Sig, str]] = {}
+        # tab_id -> the tab's TextArea, so save/reload skip a DOM query.
+        self._editors: dict[str, TextArea] = {}
+        # tab_id -> text for tabs whose TextArea is built on first activation.
+        self._pending: dict[str, str] = {}
+        # Last tab reported by TabActivated; re-opening it is a no-op.
+        self._active_tab: str | None = None
+        # Serializes threaded writes so an auto-save and Ctrl+S cannot interleave.
+        self._save_lock = asyncio.Lock()
+        self._reload_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with TabbedContent(id="tabs"):
@@ -66,37 +156,100 @@ class YamlEditor(Static):
             self.notify("Cannot open unresolved module.", severity="warning")
             return
 
-        path = module.path
-        tabs = self.query_one(TabbedContent)
-
         # Unique ID for the tab
         # Using name might conflict if same name in diff groups?
         # Using full path hash or group-name is safer.
-        norm_group = module.group.replace("/", "_").replace(" ", "_")
-        norm_name = module.name.replace("/", "_").replace(".", "_")
-        tab_id = f"tab-{norm_group}-{norm_name}"
+        tab_id = module.tab_id
+        if tab_id == self._active_tab:
+            return
+
+        path = module.path
+        tabs = self.query_one(TabbedContent)
 
         if tab_id in self.open_files:
             tabs.active = tab_id
             return
 
         try:
-            content = path.read_text(encoding="utf-8")
+            # Read in a thread so slow storage does not stall rendering.
+            sig, content = await asyncio.to_thread(_read_with_sig, path)
         except Exception as e:
             self.notify(f"Error reading file: {e}", severity="error")
             return
 
+        if tab_id in self.open_files:
+            # Opened by a concurrent call while we were reading.
+            tabs.active = tab_id
+            return
+
         self.open_files[tab_id] = path
+        self._synced[tab_id] = (sig, content)
 
-        # Add new tab
-        text_area = TextArea(content, language="yaml", id=f"editor-{tab_id}")
-        pane = TabPane(f"{module.name}", text_area, id=tab_id)
+        # Add new tab; the TextArea (and its highlighting pass) waits for activation.
+        self._pending[tab_id] = content
+        pane = TabPane(f"{module.name}", Static("Loading...", classes="welcome-msg"), id=tab_id)
 
         # add_pane is async
         await tabs.add_pane(pane)
         tabs.active = tab_id
 
-    def save_current_file(self, *, silent: bool = False) -> None:
+    async def open_modules(self, modules: list[ConfigModule]) -> None:
+        """
+        Open several modules in one go and activate the last one.
+
+        Files are read concurrently and all new panes are mounted in a single
+        batched update. Unresolved modules are skipped.
+        """
+        wanted = [m for m in modules if m.path and m.resolved]
+        if not wanted:
+            return
+        tabs = self.query_one(TabbedContent)
+
+        todo: dict[str, ConfigModule] = {}
+        for module in wanted:
+            if module.tab_id not in self.open_files:
+                todo.setdefault(module.tab_id, module)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_read_with_sig, module.path) for module in todo.values()),
+            return_exceptions=True,
+        )
+
+        panes: list[TabPane] = []
+        for (tab_id, module), result in zip(todo.items(), results, strict=True):
+            if isinstance(result, BaseException):
+                self.notify(f"Error reading file: {result}", severity="error")
+                continue
+            if tab_id in self.open_files:
+                continue  # opened by a concurrent call while we were reading
+            sig, content = result
+            self.open_files[tab_id] = module.path
+            self._synced[tab_id] = (sig, content)
+            self._pending[tab_id] = content
+            panes.append(TabPane(f"{module.name}", Static("Loading...", classes="welcome-msg"), id=tab_id))
+
+        if panes:
+            with self.app.batch_update():
+                waits = [tabs.add_pane(pane) for pane in panes]
+            for wait in waits:
+                await wait
+
+        last = wanted[-1].tab_id
+        if last in self.open_files:
+            tabs.active = last
+
+    async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        tab_id = event.pane.id
+        self._active_tab = tab_id
+        content = self._pending.pop(tab_id, None) if tab_id else None
+        if content is None:
+            return
+        language = "yaml" if len(content) < _HIGHLIGHT_MAX_CHARS else None
+        text_area = TextArea(content, language=language, id=f"editor-{tab_id}")
+        self._editors[tab_id] = text_area
+        await event.pane.remove_children()
+        await event.pane.mount(text_area)
+
+    async def save_current_file(self, *, silent: bool = False) -> None:
         tabs = self.query_one(TabbedContent)
         if not tabs.active:
             return
@@ -106,20 +259,21 @@ class YamlEditor(Static):
             return
 
         path = self.open_files.get(tab_id)
-        if not path:
+        text_area = self._editors.get(tab_id)
+        if not path or tab_id in self._pending:
+            return  # not shown yet, so nothing can have been edited
+        if text_area is None:
+            self.notify("Error: Tab invalid", severity="error")
             return
 
         try:
-            # We need to find the TextArea inside the active pane.
-            # tabs.get_pane(tab_id) returns the TabPane
-            pane = tabs.get_pane(tab_id)
-            if not pane:
-                self.notify("Error: Tab invalid", severity="error")
-                return
-
-            text_area = pane.query_one(TextArea)
             content = text_area.text
-            path.write_text(content, encoding="utf-8")
+            async with self._save_lock:
+                synced = self._synced.get(tab_id)
+                # Skip the write (and the mtime bump) when neither buffer nor file moved.
+                if synced is None or content != synced[1] or await asyncio.to_thread(_stat_sig, path) != synced[0]:
+                    sig = await asyncio.to_thread(_write_with_sig, path, content)
+                    self._synced[tab_id] = (sig, content)
             self.post_message(self.FileSaved(path))
             if not silent:
                 self.notify(f"Saved {path.name}")
@@ -131,28 +285,68 @@ class YamlEditor(Static):
     # TextArea handles ctrl+s? No.
     # So we can keep binding here.
     def action_save(self) -> None:
-        self.save_current_file()
+        self.run_worker(self.save_current_file())
 
-    def reload_all_tabs(self) -> None:
-        """Reload content for all open tabs from disk."""
-        tabs = self.query_one(TabbedContent)
+    def schedule_reload(self) -> None:
+        """Reload all tabs once requests stop arriving for 0.1 s."""
+        if self._reload_timer is not None:
+            self._reload_timer.stop()
+        self._reload_timer = self.set_timer(0.1, self._do_reload)
 
-        # Iterate over open files using self.open_files
-        # But we need to update usage of TextArea in tabs
+    def _do_reload(self) -> None:
+        self._reload_timer = None
+        self.run_worker(self.reload_all_tabs(), group="reload-tabs", exclusive=True)
 
+    async def reload_all_tabs(self) -> None:
+        """Reload content for all open tabs from disk."""
+        # Tabs with unsaved edits are always re-read so reload still discards them.
+        entries: list[tuple[str, Path, TextArea | None, _Sig | None, bool]] = []
         for tab_id, path in self.open_files.items():
-            if not path.exists():
-                continue
+            text_area = self._editors.get(tab_id)
+            synced = self._synced.get(tab_id)
+            if text_area is None:
+                if tab_id in self._pending:
+                    entries.append((tab_id, path, None, synced[0] if synced else None, False))
+            elif synced is None:
+                entries.append((tab_id, path, text_area, None, True))
+            else:
+                entries.append((tab_id, path, text_area, synced[0], text_area.text != synced[1]))
+
+        # Stat every open file concurrently in worker threads and read only the
+        # ones that changed. A vanished file comes back as None and keeps its
+        # buffer; an unreadable one is reported.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_read_if_changed, path, known, edited) for _, path, _, known, edited in entries),
+            return_exceptions=True,
+        )
 
-            try:
-                content = path.read_text(encoding="utf-8")
-                pane = tabs.get_pane(tab_id)
-                if pane:
-                    text_area = pane.query_one(TextArea)
-                    # Updating text might lose cursor position?
-                    # For a reload it is acceptable.
-                    text_area.text = content
-            except Exception:
-                pass
+        for (tab_id, path, text_area, _, edited), result in zip(entries, results, strict=True):
+            if result is None:
+                continue
+            if isinstance(result, (OSError, UnicodeDecodeError)):
+                self.notify(f"Could not reload {path.name}: {result}", severity="warning")
+                continue
+            if isinstance(result, Exception):
+                # e.g. ValueError from mmap when a file shrank mid-read; keep the tab as is.
+                self.notify(f"Error reloading {path.name}: {result}", severity="error")
+                continue
+            if isinstance(result, BaseException):
+                raise result  # cancellation of this worker, not a file problem
+            sig, content = result
+            if content is None:
+                continue  # untouched on disk: skip the re-highlight
+            prev = self._synced.get(tab_id)
+            self._synced[tab_id] = (sig, content)
+            if not edited and prev is not None and prev[1] == content:
+                continue  # touched but identical: the buffer already shows it
+            if text_area is None:
+                # The tab may have been activated while the reads ran.
+                text_area = self._editors.get(tab_id)
+                if text_area is None:
+                    self._pending[tab_id] = content
+                    continue
+            # Updating text might lose cursor position?
+            # For a reload it is acceptable.
+            text_area.text = content
 
         self.notify("Reloaded open files.")